@@ -0,0 +1,18 @@
+"""Gunicorn settings for ZoneOS.
+
+Run with: gunicorn -c gunicorn_conf.py zoneos.wsgi:app
+"""
+
+from zoneos.config import config
+
+bind = f"{config.host}:{config.port}"
+
+# SoCo calls block on network I/O, so threads overlap them well. Each worker
+# process runs its own discovery and keeps its own group state, so scale with
+# threads and keep a single worker.
+workers = config.workers
+threads = config.threads
+worker_class = "gthread"
+
+# Keep connections from polling web clients open between requests
+keepalive = 30
@@ -0,0 +1,5 @@
+"""Allow running ZoneOS with ``python -m zoneos``."""
+
+from zoneos.main import main
+
+main()
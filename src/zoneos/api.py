@@ -1,63 +1,163 @@
 """Flask API for Sonos control."""
 
 import logging
+from functools import wraps
+from typing import TYPE_CHECKING, Any
 
-from flask import Flask, jsonify, request, send_from_directory
+import orjson
+from flask import Flask, Response, jsonify, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+if TYPE_CHECKING:
+    from zoneos.controller import SonosController
 
 logger = logging.getLogger(__name__)
 
-# Global controller instance
-sonos_controller = None
+# Playback actions in the order the error message lists them
+_ACTIONS = ("play", "pause", "stop", "next", "previous")
+VALID_ACTIONS = frozenset(_ACTIONS)
 
+# Error payloads that never change, serialized once at import
+_NOT_INITIALIZED_BODY = orjson.dumps({"error": "Controller not initialized"})
+_INVALID_ACTION_BODY = orjson.dumps(
+    {"error": f"Invalid action. Must be one of: {list(_ACTIONS)}"}
+)
 
-def create_app() -> Flask:
-    """Create and configure Flask application."""
-    app = Flask(__name__, static_folder="../../static")
+_EMPTY_NOW_PLAYING = {"title": "", "artist": "", "album_art": "", "uri": ""}
+
+
+def _json() -> dict:
+    """Parse the request body as a JSON object with orjson.
+
+    Returns an empty dict for empty, malformed or non-object bodies.
+    """
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _not_initialized() -> Response:
+    """Return the 503 response used when the controller is missing."""
+    return Response(_NOT_INITIALIZED_BODY, status=503, mimetype="application/json")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes and parses with orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string using orjson."""
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize JSON from a string or bytes using orjson."""
+        return orjson.loads(s)
 
-    @app.route("/")
-    def index():
-        """Serve the web interface."""
-        return send_from_directory(app.static_folder, "index.html")
 
-    @app.route("/<path:filename>")
-    def static_files(filename):
-        """Serve static files."""
-        return send_from_directory(app.static_folder, filename)
+def create_app(controller: "SonosController | None" = None) -> Flask:
+    """Create and configure Flask application.
+
+    Args:
+        controller: SonosController serving the API routes, or None to
+            answer every API request with 503
+    """
+    # Only needed once the app is built, keep them off the import path
+    from flask_compress import Compress
+    from whitenoise import WhiteNoise
+
+    app = Flask(__name__, static_folder="../../static")
+    app.json = OrjsonProvider(app)
+    app.json.compact = True
+    app.json.sort_keys = False
+    app.json.mimetype = "application/json"
+
+    # Compress larger JSON responses; streamed responses are left alone so
+    # NDJSON rows still reach the client as they are produced
+    app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+    app.config["COMPRESS_MIN_SIZE"] = 512
+    app.config["COMPRESS_LEVEL"] = 4
+    app.config["COMPRESS_BR_LEVEL"] = 4
+    app.config["COMPRESS_STREAMS"] = False
+    Compress(app)
+
+    # Serve the web interface from a manifest scanned once at startup,
+    # bypassing Flask routing for static files
+    app.wsgi_app = WhiteNoise(
+        app.wsgi_app,
+        root=app.static_folder,
+        prefix="",
+        index_file=True,
+        autorefresh=False,
+        max_age=3600,
+    )
+
+    def require(*fields: str):
+        """Require an initialized controller and the given JSON body fields.
+
+        The wrapped view receives each field as a keyword argument. The
+        missing-field error body is serialized once, when the view is decorated.
+
+        Args:
+            *fields: Names of fields that must be present in the JSON body
+        """
+        missing_body = b""
+        if fields:
+            names = " or ".join(f"'{field}'" for field in fields)
+            missing_body = orjson.dumps({"error": f"Missing {names} field"})
+
+        def decorator(view):
+            @wraps(view)
+            def wrapper(**kwargs):
+                if not controller:
+                    return _not_initialized()
+
+                if fields:
+                    data = _json()
+                    if any(field not in data for field in fields):
+                        return Response(
+                            missing_body, status=400, mimetype="application/json"
+                        )
+                    kwargs.update((field, data[field]) for field in fields)
+
+                return view(**kwargs)
+
+            return wrapper
+
+        return decorator
+
+    @app.route("/api/health", methods=["GET"])
+    @require()
+    def health():
+        """Report liveness without waiting on speaker initialization."""
+        return jsonify({"status": "ok"})
 
     @app.route("/api/speakers", methods=["GET"])
+    @require()
     def list_speakers():
         """List all discovered Sonos speakers."""
-        if not sonos_controller:
-            return jsonify({"error": "Controller not initialized"}), 503
-
-        speakers = sonos_controller.list_speakers()
+        speakers = controller.list_speakers()
         return jsonify({"speakers": speakers})
 
     @app.route("/api/speaker/volume/<speaker_name>", methods=["GET"])
+    @require()
     def get_speaker_volume(speaker_name):
         """Get volume for a specific speaker."""
-        if not sonos_controller:
-            return jsonify({"error": "Controller not initialized"}), 503
-
-        volume = sonos_controller.get_volume(speaker_name)
+        volume = controller.get_volume(speaker_name)
         if volume is not None:
             return jsonify({"speaker": speaker_name, "volume": volume})
         return jsonify({"error": "Failed to get volume"}), 400
 
     @app.route("/api/play-favorite", methods=["POST"])
-    def play_favorite():
+    @require("speaker", "favorite")
+    def play_favorite(speaker, favorite):
         """Play a Sonos favorite on a speaker."""
-        if not sonos_controller:
-            return jsonify({"error": "Controller not initialized"}), 503
-
-        data = request.get_json()
-        if not data or "speaker" not in data or "favorite" not in data:
-            return jsonify({"error": "Missing 'speaker' or 'favorite' field"}), 400
-
-        speaker = data["speaker"]
-        favorite = data["favorite"]
-
-        success = sonos_controller.play_favorite(speaker, favorite)
+        success = controller.play_favorite(speaker, favorite)
         if success:
             return jsonify(
                 {"status": "ok", "message": f"Playing {favorite} on {speaker}"}
@@ -65,26 +165,15 @@ def create_app() -> Flask:
         return jsonify({"error": "Failed to play favorite"}), 400
 
     @app.route("/api/control", methods=["POST"])
-    def control_playback():
+    @require("speaker", "action")
+    def control_playback(speaker, action):
         """Control playback on a speaker."""
-        if not sonos_controller:
-            return jsonify({"error": "Controller not initialized"}), 503
-
-        data = request.get_json()
-        if not data or "speaker" not in data or "action" not in data:
-            return jsonify({"error": "Missing 'speaker' or 'action' field"}), 400
-
-        speaker = data["speaker"]
-        action = data["action"]
-
-        valid_actions = ["play", "pause", "stop", "next", "previous"]
-        if action not in valid_actions:
-            return (
-                jsonify({"error": f"Invalid action. Must be one of: {valid_actions}"}),
-                400,
+        if action not in VALID_ACTIONS:
+            return Response(
+                _INVALID_ACTION_BODY, status=400, mimetype="application/json"
             )
 
-        success = sonos_controller.control_playback(speaker, action)
+        success = controller.control_playback(speaker, action)
         if success:
             return jsonify(
                 {"status": "ok", "message": f"Executed {action} on {speaker}"}
@@ -92,25 +181,16 @@ def create_app() -> Flask:
         return jsonify({"error": f"Failed to execute {action}"}), 400
 
     @app.route("/api/volume", methods=["POST"])
-    def set_volume():
+    @require("speaker", "volume")
+    def set_volume(speaker, volume):
         """Set volume on a speaker."""
-        if not sonos_controller:
-            return jsonify({"error": "Controller not initialized"}), 503
-
-        data = request.get_json()
-        if not data or "speaker" not in data or "volume" not in data:
-            return jsonify({"error": "Missing 'speaker' or 'volume' field"}), 400
-
-        speaker = data["speaker"]
-        volume = data["volume"]
-
         if not isinstance(volume, int) or volume < 0 or volume > 100:
             return (
                 jsonify({"error": "Volume must be an integer between 0 and 100"}),
                 400,
             )
 
-        success = sonos_controller.set_volume(speaker, volume)
+        success = controller.set_volume(speaker, volume)
         if success:
             return jsonify(
                 {"status": "ok", "message": f"Set volume to {volume} on {speaker}"}
@@ -118,59 +198,52 @@ def create_app() -> Flask:
         return jsonify({"error": "Failed to set volume"}), 400
 
     @app.route("/api/play-uri", methods=["POST"])
-    def play_uri():
+    @require("speaker", "uri")
+    def play_uri(speaker, uri):
         """Play audio from a URI on a speaker."""
-        if not sonos_controller:
-            return jsonify({"error": "Controller not initialized"}), 503
-
-        data = request.get_json()
-        if not data or "speaker" not in data or "uri" not in data:
-            return jsonify({"error": "Missing 'speaker' or 'uri' field"}), 400
-
-        speaker = data["speaker"]
-        uri = data["uri"]
-
-        success = sonos_controller.play_uri(speaker, uri)
+        success = controller.play_uri(speaker, uri)
         if success:
             return jsonify({"status": "ok", "message": f"Playing URI on {speaker}"})
         return jsonify({"error": "Failed to play URI"}), 400
 
     @app.route("/api/favorites", methods=["GET"])
+    @require()
     def list_favorites():
         """List all Sonos favorites."""
-        if not sonos_controller:
-            return jsonify({"error": "Controller not initialized"}), 503
+        return Response(controller.get_favorites_json(), mimetype="application/json")
+
+    @app.route("/api/favorites.ndjson", methods=["GET"])
+    @require()
+    def stream_favorites():
+        """Stream Sonos favorites as newline-delimited JSON."""
+        favorites = controller.get_favorites()
 
-        favorites = sonos_controller.get_favorites()
-        return jsonify({"favorites": favorites})
+        def generate():
+            for favorite in favorites:
+                yield orjson.dumps(favorite) + b"\n"
+
+        return Response(
+            stream_with_context(generate()), mimetype="application/x-ndjson"
+        )
 
     @app.route("/api/favorites/refresh", methods=["POST"])
+    @require()
     def refresh_favorites():
         """Refresh the favorites list from Sonos system."""
-        if not sonos_controller:
-            return jsonify({"error": "Controller not initialized"}), 503
-
-        success = sonos_controller.refresh_favorites()
+        success = controller.refresh_favorites()
         if success:
-            count = len(sonos_controller.get_favorites())
+            count = len(controller.get_favorites())
             return jsonify({"status": "ok", "message": f"Refreshed {count} favorites"})
         return jsonify({"error": "Failed to refresh favorites"}), 400
 
     @app.route("/api/group", methods=["POST"])
-    def set_group():
+    @require("speakers")
+    def set_group(speakers):
         """Create or update the speaker group."""
-        if not sonos_controller:
-            return jsonify({"error": "Controller not initialized"}), 503
-
-        data = request.get_json()
-        if not data or "speakers" not in data:
-            return jsonify({"error": "Missing 'speakers' field"}), 400
-
-        speakers = data["speakers"]
         if not isinstance(speakers, list) or len(speakers) == 0:
             return jsonify({"error": "'speakers' must be a non-empty list"}), 400
 
-        success = sonos_controller.set_group(speakers)
+        success = controller.set_group(speakers)
         if success:
             return jsonify(
                 {
@@ -181,21 +254,13 @@ def create_app() -> Flask:
         return jsonify({"error": "Failed to create group"}), 400
 
     @app.route("/api/play-favorite-index", methods=["POST"])
-    def play_favorite_index():
+    @require("index")
+    def play_favorite_index(index):
         """Play a favorite by index (0-based) on the group."""
-        if not sonos_controller:
-            return jsonify({"error": "Controller not initialized"}), 503
-
-        data = request.get_json()
-        if not data or "index" not in data:
-            return jsonify({"error": "Missing 'index' field"}), 400
-
-        index = data["index"]
-
         if not isinstance(index, int) or index < 0:
             return jsonify({"error": "Index must be a non-negative integer"}), 400
 
-        success = sonos_controller.play_favorite_by_index(index)
+        success = controller.play_favorite_by_index(index)
         if success:
             return jsonify(
                 {"status": "ok", "message": f"Playing favorite #{index} on group"}
@@ -203,12 +268,10 @@ def create_app() -> Flask:
         return jsonify({"error": "Failed to play favorite"}), 400
 
     @app.route("/api/next", methods=["GET"])
+    @require()
     def play_next_favorite():
         """Play the next favorite in the list (with rollover)."""
-        if not sonos_controller:
-            return jsonify({"error": "Controller not initialized"}), 503
-
-        success = sonos_controller.play_next_favorite()
+        success = controller.play_next_favorite()
         if success:
             return jsonify(
                 {"status": "ok", "message": "Playing next favorite on group"}
@@ -216,23 +279,21 @@ def create_app() -> Flask:
         return jsonify({"error": "Failed to play next favorite"}), 400
 
     @app.route("/api/now-playing", methods=["GET"])
+    @require()
     def get_now_playing():
         """Get currently playing track information from the group coordinator."""
-        if not sonos_controller:
-            return jsonify({"error": "Controller not initialized"}), 503
-
-        now_playing = sonos_controller.get_now_playing()
-        if now_playing:
-            return jsonify(now_playing)
-        return jsonify({"title": "", "artist": "", "album_art": "", "uri": ""})
+        now_playing = controller.get_now_playing() or _EMPTY_NOW_PLAYING
+        response = jsonify(now_playing)
+        response.cache_control.max_age = 1
+        return response
 
     @app.route("/api/group-status", methods=["GET"])
+    @require()
     def get_group_status():
         """Get current group status including members and volumes."""
-        if not sonos_controller:
-            return jsonify({"error": "Controller not initialized"}), 503
-
-        status = sonos_controller.get_group_status()
-        return jsonify(status)
+        status = controller.get_group_status()
+        response = jsonify(status)
+        response.cache_control.max_age = 1
+        return response
 
     return app
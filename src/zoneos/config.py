@@ -4,18 +4,27 @@ import os
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """Application configuration."""
 
     # Server settings
     host: str = "0.0.0.0"
     port: int = 8000
-    debug: bool = True
+    debug: bool = False
+    workers: int = 1  # gunicorn worker processes
+    threads: int = 16  # gunicorn threads per worker
 
     # Sonos settings
     discovery_timeout: int = 5  # seconds
+    discovery_network_scan: bool = False  # fall back to scanning the subnet
+    request_timeout: float = 10.0  # seconds, per SoCo network request
     auto_group_on_startup: bool = True
+    warm_up_on_startup: bool = True  # load favorites/group once discovered
+    status_cache_ttl: float = 0.5  # seconds
+    favorites_ttl: float = 300.0  # seconds, 0 disables automatic refresh
+    speaker_cache: str = "~/.cache/zoneos/speakers.json"  # empty disables
+    speaker_cache_ttl: float = 86400.0  # seconds
 
     # Logging
     log_level: str = "INFO"
@@ -27,10 +36,27 @@ class Config:
         return cls(
             host=os.getenv("ZONEOS_HOST", "0.0.0.0"),
             port=int(os.getenv("ZONEOS_PORT", "8000")),
-            debug=os.getenv("ZONEOS_DEBUG", "true").lower() == "true",
+            debug=os.getenv("ZONEOS_DEBUG", "false").lower() == "true",
+            workers=int(os.getenv("ZONEOS_WORKERS", "1")),
+            threads=int(os.getenv("ZONEOS_THREADS", "16")),
             discovery_timeout=int(os.getenv("ZONEOS_DISCOVERY_TIMEOUT", "5")),
+            discovery_network_scan=os.getenv(
+                "ZONEOS_DISCOVERY_NETWORK_SCAN", "false"
+            ).lower()
+            == "true",
+            request_timeout=float(os.getenv("ZONEOS_REQUEST_TIMEOUT", "10")),
             auto_group_on_startup=os.getenv("ZONEOS_AUTO_GROUP", "true").lower()
             == "true",
+            warm_up_on_startup=os.getenv("ZONEOS_WARM_UP", "true").lower() == "true",
+            status_cache_ttl=float(os.getenv("ZONEOS_STATUS_CACHE_TTL", "0.5")),
+            favorites_ttl=float(os.getenv("ZONEOS_FAVORITES_TTL", "300")),
+            speaker_cache=os.getenv(
+                "ZONEOS_SPEAKER_CACHE",
+                os.path.join(
+                    os.getenv("XDG_CACHE_HOME", "~/.cache"), "zoneos", "speakers.json"
+                ),
+            ),
+            speaker_cache_ttl=float(os.getenv("ZONEOS_SPEAKER_CACHE_TTL", "86400")),
             log_level=os.getenv("ZONEOS_LOG_LEVEL", "INFO"),
             log_format=os.getenv(
                 "ZONEOS_LOG_FORMAT",
@@ -1,8 +1,16 @@
 """Refactored Sonos controller using modular components."""
 
+import functools
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from soco.exceptions import SoCoException
 
 from zoneos.config import config
+from zoneos.exceptions import NoSpeakersAvailableError
 from zoneos.favorites import FavoritesManager
 from zoneos.groups import GroupManager
 from zoneos.playback import PlaybackController
@@ -10,6 +18,32 @@ from zoneos.speakers import SpeakerManager
 
 logger = logging.getLogger(__name__)
 
+# Runs independent startup network tasks (favorites, grouping) concurrently
+_io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="zoneos-io")
+
+
+def _ttl_cached(method):
+    """Cache a polled status method's result for ``config.status_cache_ttl``.
+
+    Bursts of polling from several clients collapse into one speaker query.
+    ``None`` results are not cached so failures are retried immediately.
+    """
+    key = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        now = time.monotonic()
+        cached = self._status_cache.get(key)
+        if cached is not None and now - cached[0] < config.status_cache_ttl:
+            return cached[1]
+
+        result = method(self)
+        if result is not None:
+            self._status_cache[key] = (now, result)
+        return result
+
+    return wrapper
+
 
 class SonosController:
     """Main controller that coordinates all Sonos operations."""
@@ -21,21 +55,132 @@ class SonosController:
         self.groups = GroupManager()
         self.playback = PlaybackController()
         self.current_favorite_index = 0  # Track currently playing favorite
+        self._status_cache: dict[str, tuple[float, object]] = {}
+        # Monotonic time of the last favorites load, None until first attempted
+        self._favorites_loaded_at: float | None = None
+        # Last speaker that answered a favorites query, tried first next time
+        self._query_speaker = None
+
+        # Favorites and group setup are deferred to first use so creating the
+        # controller (and booting a server worker) doesn't wait on the network
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self._group_lock = threading.Lock()
+
+        if config.warm_up_on_startup:
+            # Runs as soon as speakers are known (immediately when cached),
+            # overlapping favorites loading with the tail of discovery
+            threading.Thread(
+                target=self._ensure_initialized, name="zoneos-warm-up", daemon=True
+            ).start()
+
+    def _ensure_initialized(self) -> None:
+        """Load favorites and set up the group on first use."""
+        if self._initialized:
+            return
+
+        with self._init_lock:
+            if self._initialized:
+                return
+
+            # Load favorites and set up the group concurrently, they are
+            # independent network round-trips
+            startup_tasks = []
+            if self.speakers.list_speakers():
+                startup_tasks.append(self._init_favorites)
+                if config.auto_group_on_startup:
+                    startup_tasks.append(self._init_group)
+
+            for future in [_io_pool.submit(task) for task in startup_tasks]:
+                future.result()
+
+            self._initialized = True
+
+    def _init_favorites(self) -> None:
+        """Load favorites on startup."""
+        # Stamped before the fetch so a failing speaker is retried once per
+        # TTL rather than on every request
+        self._favorites_loaded_at = time.monotonic()
+        try:
+            self._refresh_favorites_from_any_speaker()
+        except Exception as e:
+            logger.error("Failed to refresh favorites: %s", e)
 
-        # Initialize favorites
-        if self.speakers.list_speakers():
-            try:
-                speaker = self.speakers.get_any_speaker()
-                self.favorites.refresh(speaker)
-            except Exception as e:
-                logger.error(f"Failed to refresh favorites: {e}")
+    def _init_group(self) -> None:
+        """Initialize group with all speakers on startup."""
+        try:
+            self._ensure_group()
+        except Exception as e:
+            logger.error("Failed to initialize group: %s", e)
 
-        # Initialize group with all speakers if configured
-        if config.auto_group_on_startup and self.speakers.list_speakers():
-            try:
+    def _ensure_group(self):
+        """Return the group coordinator, grouping all speakers if there is none.
+
+        This is the only place the group is built from scratch; the lock
+        keeps concurrent callers from each regrouping every speaker.
+
+        Returns:
+            Group coordinator, or None if no speakers are available
+
+        Raises:
+            GroupOperationError: If group initialization fails
+        """
+        coordinator = self.groups.get_coordinator()
+        if coordinator:
+            return coordinator
+
+        with self._group_lock:
+            coordinator = self.groups.get_coordinator()
+            if not coordinator and self.speakers.list_speakers():
+                logger.info("No group set, initializing with all speakers")
                 self.groups.initialize(self.speakers.speakers)
-            except Exception as e:
-                logger.error(f"Failed to initialize group: {e}")
+                coordinator = self.groups.get_coordinator()
+        return coordinator
+
+    def _refresh_favorites_from_any_speaker(self) -> None:
+        """Refresh favorites, failing over to the next speaker on errors.
+
+        Favorites are shared by the whole household, so any speaker can
+        answer. The last speaker that did is tried first.
+
+        Raises:
+            NoSpeakersAvailableError: If no speakers are available
+            SoCoException: If every speaker failed to answer
+        """
+        speakers = list(self.speakers.speakers.values())
+        if not speakers:
+            raise NoSpeakersAvailableError("No speakers available")
+        if self._query_speaker in speakers:
+            speakers.remove(self._query_speaker)
+            speakers.insert(0, self._query_speaker)
+
+        for speaker in speakers:
+            try:
+                self.favorites.refresh(speaker)
+            except (SoCoException, requests.RequestException) as e:
+                logger.warning("Favorites query failed, trying next speaker: %s", e)
+                error = e
+                continue
+            self._query_speaker = speaker
+            return
+
+        raise error
+
+    def _refresh_stale_favorites(self) -> None:
+        """Reload favorites once they are older than ``config.favorites_ttl``."""
+        self._ensure_initialized()
+        loaded_at = self._favorites_loaded_at
+        if (
+            loaded_at is not None
+            and config.favorites_ttl > 0
+            and time.monotonic() - loaded_at >= config.favorites_ttl
+        ):
+            logger.info("Favorites are stale, reloading")
+            self._init_favorites()
+
+    def _invalidate_status(self) -> None:
+        """Drop cached status so the next poll reflects a state change."""
+        self._status_cache.clear()
 
     # Speaker operations
     def list_speakers(self) -> list[str]:
@@ -53,9 +198,10 @@ class SonosController:
         """Set volume for the specified speaker (0-100)."""
         try:
             self.speakers.set_volume(speaker_name, volume)
+            self._invalidate_status()
             return True
         except Exception as e:
-            logger.error(f"Failed to set volume: {e}")
+            logger.error("Failed to set volume: %s", e)
             return False
 
     def get_volume(self, speaker_name: str) -> int | None:
@@ -63,66 +209,74 @@ class SonosController:
         try:
             return self.speakers.get_volume(speaker_name)
         except Exception as e:
-            logger.error(f"Failed to get volume: {e}")
+            logger.error("Failed to get volume: %s", e)
             return None
 
     # Favorites operations
     def get_favorites(self) -> list[dict[str, str]]:
         """Get cached list of Sonos favorites."""
+        self._refresh_stale_favorites()
         return self.favorites.get_all()
 
+    def get_favorites_json(self) -> bytes:
+        """Get cached list of Sonos favorites pre-serialized as JSON."""
+        self._refresh_stale_favorites()
+        return self.favorites.get_all_json()
+
     def refresh_favorites(self) -> bool:
         """Refresh the favorites list from Sonos system."""
         try:
-            speaker = self.speakers.get_any_speaker()
-            self.favorites.refresh(speaker)
+            self._refresh_favorites_from_any_speaker()
+            self._favorites_loaded_at = time.monotonic()
             return True
         except Exception as e:
-            logger.error(f"Failed to refresh favorites: {e}")
+            logger.error("Failed to refresh favorites: %s", e)
             return False
 
+    def _play_favorite_on(self, speaker, favorite: dict) -> None:
+        """Play a resolved favorite, with its metadata when it has any."""
+        if favorite["metadata"] is None:
+            self.playback.play_uri(speaker, favorite["uri"])
+        else:
+            self.playback.play_uri_with_metadata(
+                speaker, favorite["uri"], favorite["metadata"]
+            )
+
     def play_favorite(self, speaker_name: str, favorite_name: str) -> bool:
         """Play a Sonos favorite on the specified speaker."""
+        self._refresh_stale_favorites()
         try:
             speaker = self.speakers.get_speaker(speaker_name)
             favorite = self.favorites.get_by_title(speaker, favorite_name)
-            self.playback.play_uri_with_metadata(
-                speaker, favorite["uri"], favorite["metadata"]
-            )
-            logger.info(f"Playing favorite '{favorite_name}' on {speaker_name}")
+            self._play_favorite_on(speaker, favorite)
+            self._invalidate_status()
+            logger.info("Playing favorite '%s' on %s", favorite_name, speaker_name)
             return True
         except Exception as e:
-            logger.error(f"Failed to play favorite: {e}")
+            logger.error("Failed to play favorite: %s", e)
+            return False
+
+    def _play_on_group(self, index: int, favorite: dict) -> bool:
+        """Play a resolved favorite on the group coordinator and track its index."""
+        coordinator = self._ensure_group()
+        if not coordinator:
+            logger.error("No group coordinator available")
             return False
 
+        self._play_favorite_on(coordinator, favorite)
+        # Track the current favorite index
+        self.current_favorite_index = index
+        self._invalidate_status()
+        logger.info("Playing favorite #%s '%s' on group", index, favorite["title"])
+        return True
+
     def play_favorite_by_index(self, index: int) -> bool:
         """Play a favorite by its index (0-based) on the group coordinator."""
+        self._refresh_stale_favorites()
         try:
-            coordinator = self.groups.get_coordinator()
-            if not coordinator:
-                # Auto-initialize group if no coordinator
-                if self.speakers.list_speakers():
-                    logger.info("No group set, initializing with all speakers")
-                    self.groups.initialize(self.speakers.speakers)
-                    coordinator = self.groups.get_coordinator()
-                else:
-                    logger.error("No speakers available")
-                    return False
-
-            if not coordinator:
-                logger.error("Failed to initialize group coordinator")
-                return False
-
-            favorite = self.favorites.get_by_index(coordinator, index)
-            self.playback.play_uri_with_metadata(
-                coordinator, favorite["uri"], favorite["metadata"]
-            )
-            # Track the current favorite index
-            self.current_favorite_index = index
-            logger.info(f"Playing favorite #{index} '{favorite['title']}' on group")
-            return True
+            return self._play_on_group(index, self.favorites.get_by_index(index))
         except Exception as e:
-            logger.error(f"Failed to play favorite by index: {e}")
+            logger.error("Failed to play favorite by index: %s", e)
             return False
 
     def play_next_favorite(self) -> bool:
@@ -131,19 +285,16 @@ class SonosController:
         Returns:
             True if successful, False otherwise
         """
+        self._refresh_stale_favorites()
         try:
-            favorites = self.get_favorites()
-            if not favorites:
+            next_favorite = self.favorites.get_next(self.current_favorite_index)
+            if next_favorite is None:
                 logger.error("No favorites available to play")
                 return False
 
-            # Move to next index with rollover (all 0-based)
-            next_index = (self.current_favorite_index + 1) % len(favorites)
-
-            # Play the favorite (already 0-based)
-            return self.play_favorite_by_index(next_index)
+            return self._play_on_group(*next_favorite)
         except Exception as e:
-            logger.error(f"Failed to play next favorite: {e}")
+            logger.error("Failed to play next favorite: %s", e)
             return False
 
     # Playback operations
@@ -152,73 +303,91 @@ class SonosController:
         try:
             speaker = self.speakers.get_speaker(speaker_name)
             self.playback.play_uri(speaker, uri)
+            self._invalidate_status()
             return True
         except Exception as e:
-            logger.error(f"Failed to play URI: {e}")
+            logger.error("Failed to play URI: %s", e)
             return False
 
     def control_playback(self, speaker_name: str, action: str) -> bool:
-        """Control playback (play, pause, stop, next, previous)."""
+        """Control playback (play, pause, stop, next, previous).
+
+        Group members are controlled through the group coordinator, so one
+        call applies the action to every speaker in the group.
+        """
         try:
-            speaker = self.speakers.get_speaker(speaker_name)
-            self.playback.control(speaker, action)
+            name = self.speakers.resolve_name(speaker_name)
+            speaker = self.speakers.get_speaker(name)
+            target = self.groups.coordinator_for(name, speaker) or speaker
+            self.playback.control(target, action)
+            self._invalidate_status()
             return True
         except Exception as e:
-            logger.error(f"Failed to control playback: {e}")
+            logger.error("Failed to control playback: %s", e)
             return False
 
+    @_ttl_cached
     def get_now_playing(self) -> dict[str, str] | None:
         """Get currently playing track information from the group coordinator."""
+        self._ensure_initialized()
         try:
             coordinator = self.groups.get_coordinator()
             if not coordinator:
                 return None
             return self.playback.get_now_playing(coordinator)
         except Exception as e:
-            logger.error(f"Failed to get now playing: {e}")
+            logger.error("Failed to get now playing: %s", e)
             return None
 
     # Group operations
     def set_group(self, speaker_names: list[str]) -> bool:
         """Update the speaker group."""
+        self._ensure_initialized()
         try:
-            self.groups.set_members(self.speakers.speakers, speaker_names)
+            names = [self.speakers.resolve_name(name) for name in speaker_names]
+            if self.groups.set_members(self.speakers.speakers, names):
+                self._invalidate_status()
             return True
         except Exception as e:
-            logger.error(f"Failed to set group: {e}")
+            logger.error("Failed to set group: %s", e)
             return False
 
     def get_group_coordinator(self):
         """Get the current group coordinator."""
+        self._ensure_initialized()
         return self.groups.get_coordinator()
 
+    @_ttl_cached
     def get_group_status(self) -> dict:
         """Get current group status including members and their volumes."""
+        self._ensure_initialized()
         members = list(self.groups.get_members())
-        status = {"members": members, "volumes": {}}
-
-        for speaker_name in members:
-            volume = self.get_volume(speaker_name)
-            if volume is not None:
-                status["volumes"][speaker_name] = volume
+        if not members:
+            return {"members": [], "volumes": {}}
 
-        return status
+        return {"members": members, "volumes": self.speakers.get_volumes(members)}
 
     # Internal methods for backward compatibility with tests
     def _add_speaker_to_group(self, speaker_name: str) -> bool:
         """Add a speaker to the existing group (for backward compatibility)."""
+        self._ensure_initialized()
         try:
-            self.groups._add_speaker(self.speakers.speakers, speaker_name)
+            name = self.speakers.resolve_name(speaker_name)
+            self.groups._add_speaker(self.speakers.speakers, name)
+            self._invalidate_status()
             return True
         except Exception as e:
-            logger.error(f"Failed to add speaker to group: {e}")
+            logger.error("Failed to add speaker to group: %s", e)
             return False
 
     def _remove_speaker_from_group(self, speaker_name: str) -> bool:
         """Remove a speaker from the group (for backward compatibility)."""
+        self._ensure_initialized()
         try:
-            self.groups._remove_speaker(self.speakers.speakers, speaker_name)
+            name = self.speakers.resolve_name(speaker_name)
+            self.groups._remove_speaker(self.speakers.speakers, name)
+            self._invalidate_status()
             return True
         except Exception as e:
-            logger.error(f"Failed to remove speaker from group: {e}")
+            logger.error("Failed to remove speaker from group: %s", e)
             return False
@@ -1,22 +1,45 @@
 """Favorites management for Sonos."""
 
 import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-import soco
+import orjson
 
 from zoneos.exceptions import FavoriteNotFoundError
 
+if TYPE_CHECKING:
+    import soco
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class _Snapshot:
+    """Favorites from one refresh, swapped in as a whole so readers stay consistent."""
+
+    # Public favorite entries, as returned by get_all
+    entries: list[dict[str, str]]
+    # What get_by_index returns for each entry: title, uri and DIDL-Lite
+    # metadata (None when unavailable)
+    playable: tuple[dict[str, str | None], ...]
+    # Title -> index into entries; the first favorite wins on duplicates
+    by_title: dict[str, int]
+    # entries pre-serialized as a {"favorites": [...]} document
+    json: bytes
+
+
+_EMPTY = _Snapshot([], (), {}, orjson.dumps({"favorites": []}))
+
+
 class FavoritesManager:
     """Manages Sonos favorites."""
 
     def __init__(self):
         """Initialize favorites manager."""
-        self._favorites: list[dict[str, str]] = []
+        self._snapshot = _EMPTY
 
-    def refresh(self, speaker: soco.SoCo) -> None:
+    def refresh(self, speaker: "soco.SoCo") -> None:
         """Refresh the favorites list from Sonos system.
 
         Args:
@@ -28,20 +51,34 @@ class FavoritesManager:
         favorites = list(speaker.music_library.get_sonos_favorites())
         favorites.extend(speaker.music_library.get_favorite_radio_stations())
 
-        self._favorites = []
+        # Build into locals and publish them in one assignment, so concurrent
+        # readers see either the old favorites or the new ones, never a mix
+        entries: list[dict[str, str]] = []
+        playable: list[dict[str, str | None]] = []
+        by_title: dict[str, int] = {}
         for fav in favorites:
             try:
                 fav_data = {
                     "title": fav.title,
                     "uri": fav.get_uri(),
                 }
-                if hasattr(fav, "album_art_uri"):
-                    fav_data["album_art"] = fav.album_art_uri
-                self._favorites.append(fav_data)
+                album_art = getattr(fav, "album_art_uri", None)
+                if album_art:
+                    fav_data["album_art"] = album_art
+                # Radio stations carry no favorite metadata; keep them playable
+                metadata = getattr(fav, "resource_meta_data", None)
+                by_title.setdefault(fav_data["title"], len(entries))
+                entries.append(fav_data)
+                playable.append(
+                    {"title": fav_data["title"], "uri": fav_data["uri"], "metadata": metadata}
+                )
             except Exception as e:
-                logger.error(f"Error processing favorite '{fav}': {e}")
+                logger.error("Error processing favorite '%s': %s", fav, e)
 
-        logger.info(f"Refreshed {len(self._favorites)} favorites")
+        self._snapshot = _Snapshot(
+            entries, tuple(playable), by_title, orjson.dumps({"favorites": entries})
+        )
+        logger.info("Refreshed %s favorites", len(entries))
 
     def get_all(self) -> list[dict[str, str]]:
         """Get cached list of Sonos favorites.
@@ -49,52 +86,83 @@ class FavoritesManager:
         Returns:
             List of favorite dictionaries
         """
-        return self._favorites
+        return self._snapshot.entries
+
+    def get_all_json(self) -> bytes:
+        """Get cached favorites serialized as a ``{"favorites": [...]}`` document.
 
-    def get_by_title(self, speaker: soco.SoCo, title: str) -> dict[str, str]:
+        Returns:
+            JSON-encoded favorites, rebuilt only on refresh
+        """
+        return self._snapshot.json
+
+    def get_by_title(self, speaker: "soco.SoCo", title: str) -> dict[str, str]:
         """Get a favorite by its title and return full favorite object.
 
+        Served from the data captured at the last refresh; the favorites are
+        only refreshed from the speaker when the title is not known.
+
         Args:
-            speaker: SoCo speaker instance to query
+            speaker: SoCo speaker instance to query on a cache miss
             title: Favorite title
 
         Returns:
-            Dictionary with favorite data including metadata
+            Dictionary with favorite data including metadata (None if the
+            favorite has none)
 
         Raises:
             FavoriteNotFoundError: If favorite not found
         """
-        all_favorites = list(speaker.music_library.get_sonos_favorites())
-        all_favorites.extend(speaker.music_library.get_favorite_radio_stations())
-
-        for fav in all_favorites:
-            if fav.title == title:
-                return {
-                    "title": fav.title,
-                    "uri": fav.get_uri(),
-                    "metadata": fav.resource_meta_data,
-                }
-
-        raise FavoriteNotFoundError(f"Favorite '{title}' not found")
-
-    def get_by_index(self, speaker: soco.SoCo, index: int) -> dict[str, str]:
+        # Resolve against one snapshot, a concurrent refresh may replace it
+        snapshot = self._snapshot
+        index = snapshot.by_title.get(title)
+        if index is None:
+            self.refresh(speaker)
+            snapshot = self._snapshot
+            index = snapshot.by_title.get(title)
+            if index is None:
+                raise FavoriteNotFoundError(f"Favorite '{title}' not found")
+
+        return snapshot.playable[index]
+
+    def get_by_index(self, index: int) -> dict[str, str]:
         """Get a favorite by its index (0-based) and return full favorite object.
 
+        Served entirely from the data captured at refresh time.
+
         Args:
-            speaker: SoCo speaker instance to query
             index: 0-based index of favorite
 
         Returns:
-            Dictionary with favorite data including metadata
+            Dictionary with favorite data including metadata (None if the
+            favorite has none)
 
         Raises:
             IndexError: If index out of range
-            FavoriteNotFoundError: If favorite at index not found
         """
-        if index < 0 or index >= len(self._favorites):
+        playable = self._snapshot.playable
+        if index < 0 or index >= len(playable):
             raise IndexError(
-                f"Invalid favorite index: {index} (must be 0-{len(self._favorites)-1})"
+                f"Invalid favorite index: {index} (must be 0-{len(playable)-1})"
             )
 
-        favorite = self._favorites[index]
-        return self.get_by_title(speaker, favorite["title"])
+        return playable[index]
+
+    def get_next(self, index: int) -> tuple[int, dict[str, str | None]] | None:
+        """Get the favorite after an index, rolling over to the first.
+
+        The rollover and the favorite come from the same refresh, so the
+        favorite played is the one the index was computed for.
+
+        Args:
+            index: 0-based index of the current favorite
+
+        Returns:
+            Tuple of the next index and its favorite (as in ``get_by_index``),
+            or None if there are no favorites
+        """
+        playable = self._snapshot.playable
+        if not playable:
+            return None
+        next_index = (index + 1) % len(playable)
+        return next_index, playable[next_index]
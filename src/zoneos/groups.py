@@ -1,7 +1,10 @@
 """Group management for Sonos speakers."""
 
 import logging
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 
+import requests
 import soco
 from soco.exceptions import SoCoException
 
@@ -9,6 +12,9 @@ from zoneos.exceptions import GroupOperationError, SpeakerNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Join/unjoin calls to different speakers are independent SOAP requests
+_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="zoneos-group")
+
 
 class GroupManager:
     """Manages Sonos speaker groups."""
@@ -16,7 +22,76 @@ class GroupManager:
     def __init__(self):
         """Initialize group manager."""
         self._coordinator: soco.SoCo | None = None
-        self._members: set[str] = set()
+        # Replaced rather than mutated so get_members can hand it out as is
+        self._members: frozenset[str] = frozenset()
+        # player_name polls the zone group topology, so resolve it once per
+        # SoCo instance (they are singletons per IP address)
+        self._name_cache: dict[soco.SoCo, str] = {}
+
+    def _name(self, speaker: soco.SoCo) -> str:
+        """Return a speaker's player name, cached per SoCo instance."""
+        name = self._name_cache.get(speaker)
+        if name is None:
+            name = self._name_cache[speaker] = speaker.player_name
+        return name
+
+    def _fan_out(
+        self, action: Callable[[soco.SoCo], object], speakers: Iterable[soco.SoCo]
+    ) -> list[soco.SoCo]:
+        """Run a group action on several speakers concurrently.
+
+        A failure on one speaker is logged and does not stop the others.
+
+        Args:
+            action: Callable invoked with each speaker
+            speakers: Speakers to run the action on
+
+        Returns:
+            Speakers for which the action raised a SoCo or network error
+        """
+        futures = [(speaker, _pool.submit(action, speaker)) for speaker in speakers]
+        failed = []
+        for speaker, future in futures:
+            try:
+                future.result()
+            except (SoCoException, requests.RequestException) as e:
+                logger.error(f"Group update failed for {self._name(speaker)}: {e}")
+                failed.append(speaker)
+        return failed
+
+    def _coordinators(self, speaker: soco.SoCo) -> dict[soco.SoCo, soco.SoCo]:
+        """Map every grouped speaker to its coordinator from one topology read.
+
+        Reading ``group`` on each speaker may refetch the zone group topology
+        per speaker; ``all_groups`` resolves the whole household at once.
+
+        Args:
+            speaker: Any speaker in the household to query
+
+        Returns:
+            Dictionary of member speaker to coordinator, empty if unavailable
+        """
+        try:
+            return {
+                member: group.coordinator
+                for group in speaker.all_groups
+                for member in group.members
+            }
+        except (SoCoException, requests.RequestException) as e:
+            logger.warning(f"Failed to read group topology: {e}")
+            return {}
+
+    def _transport_state(self, speaker: soco.SoCo) -> str | None:
+        """Return a speaker's current transport state.
+
+        Returns:
+            Transport state such as "PLAYING", or None if it cannot be read
+        """
+        try:
+            transport_info = speaker.get_current_transport_info()
+        except (SoCoException, requests.RequestException):
+            return None
+        return transport_info.get("current_transport_state") if transport_info else None
 
     def initialize(self, speakers: dict[str, soco.SoCo]) -> None:
         """Initialize group with all available speakers.
@@ -35,37 +110,40 @@ class GroupManager:
             return
 
         speaker_list = list(speakers.values())
-
-        # Check if any speaker is currently playing
-        playing_speaker = None
-        for speaker in speaker_list:
-            try:
-                transport_info = speaker.get_current_transport_info()
-                if transport_info and transport_info.get("current_transport_state") in [
-                    "PLAYING",
-                    "PAUSED_PLAYBACK",
-                ]:
-                    playing_speaker = speaker
-                    logger.info(
-                        f"Detected {speaker.player_name} is already playing/paused"
-                    )
-                    break
-            except SoCoException:
-                continue
+        # Names are already known from discovery
+        self._name_cache.update((s, name) for name, s in speakers.items())
+
+        # Check if any speaker is currently playing, probing them all at once
+        # rather than one round-trip after another
+        states = _pool.map(self._transport_state, speaker_list)
+        playing_speaker = next(
+            (
+                speaker
+                for speaker, state in zip(speaker_list, states)
+                if state in ("PLAYING", "PAUSED_PLAYBACK")
+            ),
+            None,
+        )
+        if playing_speaker:
+            logger.info(
+                f"Detected {self._name(playing_speaker)} is already playing/paused"
+            )
 
         # If content is playing, use existing group structure
         if playing_speaker:
             try:
                 # Get the coordinator of the playing speaker's group
-                coordinator = playing_speaker.group.coordinator
-                group_members = {m.player_name for m in playing_speaker.group.members}
+                group = playing_speaker.group
+                coordinator = group.coordinator
+                group_members = frozenset(self._name(m) for m in group.members)
 
                 self._coordinator = coordinator
                 self._members = group_members
 
                 logger.info(
-                    f"Preserved existing group with coordinator {coordinator.player_name} "
-                    f"and {len(group_members)} members (content is playing)"
+                    "Preserved existing group with coordinator "
+                    f"{self._name(coordinator)} and {len(group_members)} members "
+                    "(content is playing)"
                 )
                 return
             except (SoCoException, AttributeError) as e:
@@ -73,47 +151,72 @@ class GroupManager:
                 # Fall through to create new group
 
         # No content playing, create new group from all speakers
-        try:
-            # First speaker becomes the coordinator
-            self._coordinator = speaker_list[0]
-            self._members = {s.player_name for s in speaker_list}
+        # First speaker becomes the coordinator
+        coordinator = speaker_list[0]
+
+        # Speakers already grouped under the coordinator are left untouched
+        current = self._coordinators(coordinator)
+        to_join = [s for s in speaker_list[1:] if current.get(s) is not coordinator]
+        if current.get(coordinator) is coordinator:
+            to_unjoin = to_join
+        else:
+            to_unjoin = [coordinator, *to_join]
 
-            # Remove all speakers from their current groups
-            for speaker in speaker_list:
-                speaker.unjoin()
+        # Remove speakers from their current groups
+        failed = self._fan_out(lambda s: s.unjoin(), to_unjoin)
+        if coordinator in failed:
+            raise GroupOperationError(
+                "Failed to initialize group: "
+                f"could not unjoin {self._name(coordinator)}"
+            )
 
-            # Join all other speakers to the coordinator
-            for speaker in speaker_list[1:]:
-                speaker.join(self._coordinator)
+        # Join the other speakers to the coordinator; a speaker that failed to
+        # unjoin may still join, so membership follows the joins alone
+        failed = self._fan_out(lambda s: s.join(coordinator), to_join)
 
-            logger.info(
-                f"Initialized group with coordinator {self._coordinator.player_name} "
-                f"and {len(speaker_list)-1} members"
-            )
-        except SoCoException as e:
-            raise GroupOperationError(f"Failed to initialize group: {e}")
+        self._coordinator = coordinator
+        self._members = frozenset(
+            self._name(s) for s in speaker_list if s not in failed
+        )
+
+        logger.info(
+            f"Initialized group with coordinator {self._name(coordinator)} "
+            f"and {len(self._members)-1} members"
+        )
 
     def set_members(
         self, speakers: dict[str, soco.SoCo], member_names: list[str]
-    ) -> None:
+    ) -> bool:
         """Update the speaker group by comparing with current members.
 
         Args:
             speakers: Dictionary of all available speakers
             member_names: List of speaker names to be in group
 
+        Returns:
+            False if the group already had exactly these members, else True
+
         Raises:
             GroupOperationError: If group update fails
         """
         if not member_names:
             raise GroupOperationError("No speakers provided for group")
 
-        new_members = set(member_names)
+        new_members = frozenset(member_names)
         current_members = self._members
+        if new_members == current_members:
+            return False
 
-        # Find speakers to add and remove
-        to_add = new_members - current_members
-        to_remove = current_members - new_members
+        # Find speakers to add and remove; a pure add or pure removal (the
+        # usual UI edit) leaves the other side empty without a set difference
+        if current_members.issuperset(new_members):
+            to_add = frozenset()
+        else:
+            to_add = new_members - current_members
+        if new_members.issuperset(current_members):
+            to_remove = frozenset()
+        else:
+            to_remove = current_members - new_members
 
         # Add speakers
         for name in to_add:
@@ -123,6 +226,8 @@ class GroupManager:
         for name in to_remove:
             self._remove_speaker(speakers, name)
 
+        return True
+
     def _add_speaker(self, speakers: dict[str, soco.SoCo], speaker_name: str) -> None:
         """Add a speaker to the existing group.
 
@@ -141,15 +246,15 @@ class GroupManager:
         if not self._coordinator:
             # No group exists, make this speaker the coordinator
             self._coordinator = speaker
-            self._members = {speaker_name}
+            self._members = frozenset((speaker_name,))
             logger.info(f"Created new group with coordinator {speaker_name}")
             return
 
         try:
             speaker.join(self._coordinator)
-            self._members.add(speaker_name)
+            self._members |= {speaker_name}
             logger.info(f"Added {speaker_name} to group")
-        except SoCoException as e:
+        except (SoCoException, requests.RequestException) as e:
             raise GroupOperationError(f"Failed to add {speaker_name} to group: {e}")
 
     def _remove_speaker(
@@ -174,18 +279,14 @@ class GroupManager:
             return
 
         try:
-            is_coordinator = (
-                self._coordinator
-                and speaker.player_name == self._coordinator.player_name
-            )
-
-            if is_coordinator:
+            # SoCo instances are singletons per IP, so identity is enough
+            if speaker is self._coordinator:
                 self._remove_coordinator(speakers, speaker, speaker_name)
             else:
                 speaker.unjoin()
-                self._members.discard(speaker_name)
+                self._members -= {speaker_name}
                 logger.info(f"Removed {speaker_name} from group")
-        except SoCoException as e:
+        except (SoCoException, requests.RequestException) as e:
             raise GroupOperationError(
                 f"Failed to remove {speaker_name} from group: {e}"
             )
@@ -194,7 +295,7 @@ class GroupManager:
         self, speakers: dict[str, soco.SoCo], speaker: soco.SoCo, speaker_name: str
     ) -> None:
         """Remove coordinator and promote new one if needed."""
-        self._members.discard(speaker_name)
+        self._members -= {speaker_name}
 
         if len(self._members) == 0:
             # Last speaker, just unjoin
@@ -217,11 +318,17 @@ class GroupManager:
             self._coordinator = new_coordinator
 
             # Rejoin remaining speakers
-            for member_name in remaining_members[1:]:
-                member_speaker = speakers.get(member_name)
-                if member_speaker and member_speaker.player_name != speaker_name:
-                    member_speaker.unjoin()
-                    member_speaker.join(new_coordinator)
+            def rejoin(member_speaker: soco.SoCo) -> None:
+                member_speaker.unjoin()
+                member_speaker.join(new_coordinator)
+
+            to_rejoin = [
+                member_speaker
+                for member_speaker in map(speakers.get, remaining_members[1:])
+                if member_speaker and self._name(member_speaker) != speaker_name
+            ]
+            for member_speaker in self._fan_out(rejoin, to_rejoin):
+                self._members -= {self._name(member_speaker)}
 
             # Remove old coordinator
             speaker.unjoin()
@@ -239,10 +346,37 @@ class GroupManager:
         """
         return self._coordinator
 
-    def get_members(self) -> set[str]:
+    def coordinator_for(
+        self, speaker_name: str, speaker: soco.SoCo
+    ) -> soco.SoCo | None:
+        """Get the coordinator that controls playback for a group member.
+
+        The group may have been changed from the Sonos app since it was last
+        set up here, so membership is confirmed against the speaker's live
+        group before redirecting.
+
+        Args:
+            speaker_name: Name of the speaker
+            speaker: SoCo instance of the speaker
+
+        Returns:
+            The speaker's live coordinator if it is a member of the group, or
+            the tracked coordinator if the live one cannot be read; None if
+            the speaker is not a member or is the coordinator itself
+        """
+        coordinator = self._coordinator
+        if speaker_name not in self._members or speaker is coordinator:
+            return None
+        try:
+            return speaker.group.coordinator
+        except (SoCoException, requests.RequestException, AttributeError) as e:
+            logger.warning(f"Failed to read group of {speaker_name}: {e}")
+            return coordinator
+
+    def get_members(self) -> frozenset[str]:
         """Get set of group member names.
 
         Returns:
-            Set of speaker names in group
+            Immutable snapshot of speaker names in group
         """
-        return self._members.copy()
+        return self._members
@@ -6,26 +6,25 @@ from zoneos.api import create_app
 from zoneos.config import config
 from zoneos.controller import SonosController
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, config.log_level),
-    format=config.log_format,
-)
-
 logger = logging.getLogger(__name__)
 
 
+def configure_logging() -> None:
+    """Configure root logging from config unless handlers are already set."""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=getattr(logging, config.log_level),
+            format=config.log_format,
+        )
+
+
 def main():
     """Initialize and run the Flask application."""
+    configure_logging()
     logger.info("Starting ZoneOS...")
 
-    # Initialize Sonos controller
-    import zoneos.api
-
-    zoneos.api.sonos_controller = SonosController()
-
-    # Create Flask app
-    app = create_app()
+    # Initialize Sonos controller and create Flask app
+    app = create_app(SonosController())
 
     logger.info(f"ZoneOS ready! Server starting on http://{config.host}:{config.port}")
 
@@ -1,6 +1,9 @@
 """Playback control for Sonos speakers."""
 
 import logging
+from collections.abc import Callable
+from operator import methodcaller
+from typing import ClassVar
 
 import soco
 from soco.exceptions import SoCoException
@@ -13,6 +16,12 @@ logger = logging.getLogger(__name__)
 class PlaybackController:
     """Handles playback operations for Sonos speakers."""
 
+    # Resolved per call so the speaker's bound method (or a test double) is used
+    _ACTIONS: ClassVar[dict[str, Callable[[soco.SoCo], object]]] = {
+        action: methodcaller(action)
+        for action in ("play", "pause", "stop", "next", "previous")
+    }
+
     def play_uri(self, speaker: soco.SoCo, uri: str) -> None:
         """Play audio from a URI on the specified speaker.
 
@@ -60,20 +69,12 @@ class PlaybackController:
         Raises:
             PlaybackError: If control action fails
         """
-        try:
-            if action == "play":
-                speaker.play()
-            elif action == "pause":
-                speaker.pause()
-            elif action == "stop":
-                speaker.stop()
-            elif action == "next":
-                speaker.next()
-            elif action == "previous":
-                speaker.previous()
-            else:
-                raise PlaybackError(f"Unknown action: {action}")
+        command = self._ACTIONS.get(action)
+        if command is None:
+            raise PlaybackError(f"Unknown action: {action}")
 
+        try:
+            command(speaker)
             logger.info(f"Executed '{action}' on {speaker.player_name}")
         except SoCoException as e:
             raise PlaybackError(
@@ -94,7 +95,9 @@ class PlaybackController:
         """
         try:
             track_info = speaker.get_current_track_info()
-            logger.info(f"Retrieved now playing from {track_info}")
+            # Polled by every client, keep it out of INFO logs and only
+            # format the track info when debugging
+            logger.debug("Retrieved now playing from %s", track_info)
             return {
                 "title": track_info.get("title", ""),
                 "artist": track_info.get("artist", ""),
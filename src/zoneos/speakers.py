@@ -1,40 +1,182 @@
 """Speaker discovery and management."""
 
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 import soco
 
+from zoneos.config import config
 from zoneos.exceptions import NoSpeakersAvailableError, SpeakerNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Bound every SOAP request so an unresponsive speaker fails fast; this is
+# process-wide SoCo state, so it is set once when the module is imported
+soco.config.REQUEST_TIMEOUT = config.request_timeout
+
+
+def _key(name: str) -> str:
+    """Normalize a speaker name for case-insensitive lookup."""
+    return name.strip().casefold()
+
+
+def _round_volume(volume: float) -> int:
+    """Round a volume to the nearest multiple of 5 and clamp it to 0-100."""
+    return max(0, min(100, round(volume / 5) * 5))
+
+
+# Precomputed results for every valid volume, the slider's hot path
+_VOLUME_STEPS = bytes(_round_volume(volume) for volume in range(101))
+
+# Volume reads on different speakers are independent SOAP requests
+_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="zoneos-speakers")
+
 
 class SpeakerManager:
     """Manages Sonos speaker discovery and basic operations."""
 
+    __slots__ = ("_speakers", "_any_speaker", "_names_by_key", "_discovered")
+
     def __init__(self):
-        """Initialize speaker manager and discover speakers."""
-        self.speakers: dict[str, soco.SoCo] = {}
-        self._discover_speakers()
+        """Initialize speaker manager and start discovery in the background.
+
+        SSDP discovery waits out its full timeout, so it runs on its own
+        thread; callers block on first access to the speakers instead of
+        at construction. Speakers saved by a previous run are served
+        immediately while discovery reconciles them.
+        """
+        self._speakers: dict[str, soco.SoCo] = {}
+        self._any_speaker: soco.SoCo | None = None
+        # Normalized name -> speaker name, for lookups that differ in case/spacing
+        self._names_by_key: dict[str, str] = {}
+        self._set_speakers(self._load_cache())
+        self._discovered = threading.Event()
+        if self._speakers:
+            self._discovered.set()
+        threading.Thread(
+            target=self._discover_speakers, name="zoneos-discovery", daemon=True
+        ).start()
+
+    @property
+    def speakers(self) -> dict[str, soco.SoCo]:
+        """Discovered speakers by name, waiting for discovery to finish."""
+        self._discovered.wait()
+        return self._speakers
+
+    def _set_speakers(self, speakers: dict[str, soco.SoCo]) -> None:
+        """Replace the known speakers and the speaker handed out as "any"."""
+        self._any_speaker = next(iter(speakers.values()), None)
+        self._names_by_key = {_key(name): name for name in speakers}
+        self._speakers = speakers
+
+    def _load_cache(self) -> dict[str, soco.SoCo]:
+        """Rebuild speakers from the on-disk cache without network I/O.
+
+        Returns:
+            Cached speakers by name, empty if the cache is disabled, missing,
+            unreadable or older than ``config.speaker_cache_ttl``
+        """
+        if not config.speaker_cache:
+            return {}
+
+        try:
+            with open(os.path.expanduser(config.speaker_cache), "rb") as f:
+                data = orjson.loads(f.read())
+            if time.time() - data["saved_at"] > config.speaker_cache_ttl:
+                return {}
+            speakers = {name: soco.SoCo(ip) for name, ip in data["speakers"].items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning("Ignoring unreadable speaker cache: %s", e)
+            return {}
+
+        logger.info("Loaded %d speakers from cache", len(speakers))
+        return speakers
+
+    def _save_cache(self) -> None:
+        """Write the discovered speakers to the on-disk cache atomically."""
+        if not config.speaker_cache:
+            return
+
+        path = os.path.expanduser(config.speaker_cache)
+        try:
+            data = orjson.dumps(
+                {
+                    "saved_at": time.time(),
+                    "speakers": {
+                        name: speaker.ip_address
+                        for name, speaker in self._speakers.items()
+                    },
+                }
+            )
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(f"{path}.tmp", "wb") as f:
+                f.write(data)
+            os.replace(f"{path}.tmp", path)
+        except Exception as e:
+            logger.warning("Failed to write speaker cache: %s", e)
 
     def _discover_speakers(self):
         """Discover all Sonos speakers on the network."""
-        logger.info("Discovering Sonos speakers...")
-        discovered = soco.discover()
+        try:
+            logger.info("Discovering Sonos speakers...")
+            # soco.discover returns on the first SSDP answer and reads the
+            # rest of the household from that speaker's zone topology; only
+            # an empty network waits out the timeout. Hosts where multicast
+            # is filtered (e.g. Docker bridge networks) can opt in to a
+            # parallel unicast scan of the local subnet instead.
+            discovered = soco.discover(
+                timeout=config.discovery_timeout,
+                allow_network_scan=config.discovery_network_scan,
+            )
 
-        if discovered:
-            for speaker in discovered:
-                self.speakers[speaker.player_name] = speaker
-                logger.info(f"Found speaker: {speaker.player_name}")
-        else:
-            logger.warning("No Sonos speakers found on the network")
+            if discovered:
+                speakers = {speaker.player_name: speaker for speaker in discovered}
+                logger.info(
+                    "Discovered %d speakers: %s", len(speakers), ", ".join(speakers)
+                )
+                self._set_speakers(speakers)
+                self._save_cache()
+            else:
+                logger.warning("No Sonos speakers found on the network")
+        except Exception as e:
+            logger.error("Speaker discovery failed: %s", e)
+        finally:
+            self._discovered.set()
 
     def list_speakers(self) -> list[str]:
         """Return list of discovered speaker names."""
         return list(self.speakers.keys())
 
+    def resolve_name(self, name: str) -> str:
+        """Resolve a user-supplied speaker name to the discovered name.
+
+        Names are matched exactly first, then ignoring case and surrounding
+        whitespace.
+
+        Args:
+            name: Speaker name
+
+        Returns:
+            Speaker name as discovered
+
+        Raises:
+            SpeakerNotFoundError: If speaker not found
+        """
+        if name in self.speakers:
+            return name
+        resolved = self._names_by_key.get(_key(name))
+        if resolved is None:
+            raise SpeakerNotFoundError(f"Speaker '{name}' not found")
+        return resolved
+
     def get_speaker(self, name: str) -> soco.SoCo:
-        """Get a speaker by name.
+        """Get a speaker by name, matched as in ``resolve_name``.
 
         Args:
             name: Speaker name
@@ -45,7 +187,7 @@ class SpeakerManager:
         Raises:
             SpeakerNotFoundError: If speaker not found
         """
-        speaker = self.speakers.get(name)
+        speaker = self.speakers.get(self.resolve_name(name))
         if not speaker:
             raise SpeakerNotFoundError(f"Speaker '{name}' not found")
         return speaker
@@ -59,9 +201,10 @@ class SpeakerManager:
         Raises:
             NoSpeakersAvailableError: If no speakers available
         """
-        if not self.speakers:
+        self._discovered.wait()
+        if self._any_speaker is None:
             raise NoSpeakersAvailableError("No speakers available")
-        return next(iter(self.speakers.values()))
+        return self._any_speaker
 
     def set_volume(self, speaker_name: str, volume: int) -> None:
         """Set volume for the specified speaker (0-100).
@@ -77,12 +220,12 @@ class SpeakerManager:
             SoCoException: If volume setting fails
         """
         speaker = self.get_speaker(speaker_name)
-        # Round to nearest multiple of 5
-        rounded_volume = round(volume / 5) * 5
-        # Clamp to 0-100 range
-        clamped_volume = max(0, min(100, rounded_volume))
+        if type(volume) is int and 0 <= volume <= 100:
+            clamped_volume = _VOLUME_STEPS[volume]
+        else:
+            clamped_volume = _round_volume(volume)
         speaker.volume = clamped_volume
-        logger.info(f"Set volume to {clamped_volume} on {speaker_name}")
+        logger.info("Set volume to %d on %s", clamped_volume, speaker_name)
 
     def get_volume(self, speaker_name: str) -> int:
         """Get current volume for the specified speaker.
@@ -99,3 +242,25 @@ class SpeakerManager:
         """
         speaker = self.get_speaker(speaker_name)
         return speaker.volume
+
+    def get_volumes(self, speaker_names: list[str]) -> dict[str, int]:
+        """Get current volumes for several speakers concurrently.
+
+        Speakers that are unknown or fail to answer are logged and left out.
+
+        Args:
+            speaker_names: Names of the speakers
+
+        Returns:
+            Dictionary of speaker name to volume level
+        """
+        futures = {
+            name: _pool.submit(self.get_volume, name) for name in speaker_names
+        }
+        volumes = {}
+        for name, future in futures.items():
+            try:
+                volumes[name] = future.result()
+            except Exception as e:
+                logger.error("Failed to get volume for %s: %s", name, e)
+        return volumes
@@ -0,0 +1,9 @@
+"""WSGI entry point for running ZoneOS under a production server."""
+
+from zoneos.api import create_app
+from zoneos.controller import SonosController
+from zoneos.main import configure_logging
+
+configure_logging()
+
+app = create_app(SonosController())
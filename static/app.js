@@ -354,12 +354,11 @@ class ZoneOS {
     const container = document.getElementById("favorites-container");
 
     try {
-      const resp = await fetch("/api/favorites");
-      const data = await resp.json();
+      const favorites = await this.fetchFavorites();
 
-      if (data.favorites && data.favorites.length > 0) {
-        this._cachedFavorites = data.favorites;
-        const items = data.favorites.map((fav, i) =>
+      if (favorites.length > 0) {
+        this._cachedFavorites = favorites;
+        const items = favorites.map((fav, i) =>
           this.createFavoriteElement(fav, i + 1)
         );
         container.innerHTML = `<div class="grid gap-3">${items.join("")}</div>`;
@@ -377,6 +376,38 @@ class ZoneOS {
     }
   }
 
+  /**
+   * Fetch favorites from the newline-delimited JSON stream, parsing rows
+   * as they arrive
+   */
+  async fetchFavorites() {
+    const resp = await fetch("/api/favorites.ndjson");
+    if (!resp.ok || !resp.body) {
+      throw new Error(`HTTP ${resp.status}`);
+    }
+
+    const reader = resp.body.getReader();
+    const decoder = new TextDecoder();
+    const favorites = [];
+    let buffer = "";
+
+    for (;;) {
+      const { done, value } = await reader.read();
+      buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+
+      const lines = buffer.split("\n");
+      buffer = lines.pop();
+      for (const line of lines) {
+        if (line) favorites.push(JSON.parse(line));
+      }
+
+      if (done) break;
+    }
+
+    if (buffer) favorites.push(JSON.parse(buffer));
+    return favorites;
+  }
+
   /**
    * Create favorite DOM element
    */
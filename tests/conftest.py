@@ -1,10 +1,34 @@
 """Shared test fixtures and configuration."""
 
+import dataclasses
+from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def speaker_cache_path(tmp_path):
+    """Point the speaker cache at a per-test file instead of the home dir."""
+    from zoneos.config import config
+
+    path = tmp_path / "speakers.json"
+    with patch(
+        "zoneos.speakers.config", dataclasses.replace(config, speaker_cache=str(path))
+    ):
+        yield path
+
+
+@pytest.fixture(autouse=True)
+def no_warm_up():
+    """Keep controller initialization on first use so tests control timing."""
+    from zoneos.config import config
+
+    test_config = dataclasses.replace(config, warm_up_on_startup=False)
+    with patch("zoneos.controller.config", test_config):
+        yield
+
+
 @pytest.fixture
 def mock_soco_discover():
     """Mock the soco.discover function."""
@@ -37,29 +61,130 @@ def mock_speakers():
     return speakers
 
 
+@dataclass(slots=True)
+class FakeFavorite:
+    """Plain stand-in for a SoCo favorite.
+
+    Unlike a MagicMock, attributes left as None read as None rather than as
+    auto-created mocks, and get_uri() calls are counted in ``uri_reads``.
+    """
+
+    title: str
+    uri: str
+    resource_meta_data: str | None = None
+    album_art_uri: str | None = None
+    uri_reads: int = 0
+
+    def get_uri(self) -> str:
+        """Return the favorite's URI."""
+        self.uri_reads += 1
+        return self.uri
+
+
+@pytest.fixture(scope="session")
+def make_favorite():
+    """Factory for fake Sonos favorites."""
+    return FakeFavorite
+
+
+@pytest.fixture(scope="session")
+def make_favorites():
+    """Factory for ``n`` numbered fake favorites ("Favorite 1", "uri1", ...)."""
+
+    def make(n: int) -> list[FakeFavorite]:
+        return [
+            FakeFavorite(f"Favorite {i}", f"uri{i}", f"<DIDL-Lite>{i}</DIDL-Lite>")
+            for i in range(1, n + 1)
+        ]
+
+    return make
+
+
 @pytest.fixture
 def mock_favorite():
-    """Create a mock Sonos favorite."""
-    fav = MagicMock()
-    fav.title = "Test Favorite"
-    fav.get_uri.return_value = "x-rincon-cpcontainer:1004206c..."
-    fav.album_art_uri = "http://example.com/art.jpg"
-    fav.resource_meta_data = "<DIDL-Lite>...</DIDL-Lite>"
-    return fav
+    """Create a fake Sonos favorite."""
+    return FakeFavorite(
+        title="Test Favorite",
+        uri="x-rincon-cpcontainer:1004206c...",
+        resource_meta_data="<DIDL-Lite>...</DIDL-Lite>",
+        album_art_uri="http://example.com/art.jpg",
+    )
+
+
+@pytest.fixture(scope="module")
+def _shared_controller():
+    """Controller discovered once per module, reused by the reset fixtures."""
+    from zoneos.config import config
+    from zoneos.controller import SonosController
+
+    speaker = MagicMock()
+    speaker.player_name = "Living Room"
+    test_config = dataclasses.replace(
+        config, speaker_cache="", warm_up_on_startup=False
+    )
+    with (
+        patch("zoneos.speakers.config", test_config),
+        patch("zoneos.controller.config", test_config),
+        patch("zoneos.speakers.soco.discover", return_value=[speaker]),
+    ):
+        controller = SonosController()
+        controller.list_speakers()
+    return controller
+
+
+def _reset_controller(controller, speakers):
+    """Put a shared controller back to its freshly discovered state.
+
+    The given speakers replace the discovered ones; favorites, the group
+    and every cache are rebuilt lazily on first use.
+    """
+    from zoneos.favorites import FavoritesManager
+    from zoneos.groups import GroupManager
+
+    controller.speakers._set_speakers({s.player_name: s for s in speakers})
+    controller.favorites = FavoritesManager()
+    controller.groups = GroupManager()
+    controller.current_favorite_index = 0
+    controller._favorites_loaded_at = None
+    controller._query_speaker = None
+    controller._initialized = False
+    controller._invalidate_status()
+    return controller
+
+
+# Speakers are cheap to build, so the shared controllers get fresh ones per
+# test. Resetting one shared mock instead is not safe: reset_mock with
+# return_value or side_effect also clears MagicMock's defaults for magic
+# methods such as __iter__ and __bool__.
+@pytest.fixture
+def base_speaker(mock_speaker):
+    """The single speaker behind base_controller, fresh for each test."""
+    return mock_speaker
 
 
 @pytest.fixture
-def controller_with_speakers(mock_soco_discover, mock_speakers):
-    """Create a controller with pre-configured speakers."""
-    mock_soco_discover.return_value = mock_speakers
-    from zoneos.controller import SonosController
+def base_controller(_shared_controller, base_speaker):
+    """Shared controller with base_speaker as its only speaker.
 
-    return SonosController()
+    Tests that exercise discovery or startup grouping still build their
+    own controller.
+    """
+    return _reset_controller(_shared_controller, [base_speaker])
 
 
 @pytest.fixture
+def controller_with_speakers(_shared_controller, mock_speakers):
+    """Shared controller with the three mock speakers."""
+    return _reset_controller(_shared_controller, mock_speakers)
+
+
+@pytest.fixture(scope="session")
 def flask_app():
-    """Create a Flask test app."""
+    """Create a Flask test app without a controller, shared by all tests.
+
+    The app holds no per-test state: the controller is bound when the app
+    is created, so tests that need one build their own app.
+    """
     from zoneos.api import create_app
 
     app = create_app()
@@ -1,6 +1,8 @@
 """Test Flask API endpoints."""
 
 import json
+import subprocess
+import sys
 from unittest.mock import MagicMock
 
 import pytest
@@ -8,7 +10,7 @@ import pytest
 
 @pytest.fixture
 def mock_controller():
-    """Mock the sonos_controller instance."""
+    """Mock the SonosController instance."""
     controller = MagicMock()
     controller.list_speakers.return_value = ["Living Room", "Bedroom"]
     controller.get_volume.return_value = 50
@@ -16,6 +18,9 @@ def mock_controller():
         {"title": "Radio 1", "uri": "x-rincon-cpcontainer:1"},
         {"title": "Playlist", "uri": "x-rincon-cpcontainer:2"},
     ]
+    controller.get_favorites_json.return_value = json.dumps(
+        {"favorites": controller.get_favorites.return_value}
+    ).encode()
     controller.get_group_status.return_value = {
         "members": ["Living Room", "Bedroom"],
         "volumes": {"Living Room": 50, "Bedroom": 45},
@@ -30,12 +35,13 @@ def mock_controller():
 
 
 @pytest.fixture
-def client_with_controller(flask_app, mock_controller):
+def client_with_controller(mock_controller):
     """Create a Flask test client with mocked controller."""
-    import zoneos.api
+    from zoneos.api import create_app
 
-    zoneos.api.sonos_controller = mock_controller
-    return flask_app.test_client()
+    app = create_app(mock_controller)
+    app.config["TESTING"] = True
+    return app.test_client()
 
 
 def test_index_route(client):
@@ -45,6 +51,68 @@ def test_index_route(client):
     assert b"html" in response.data or b"DOCTYPE" in response.data
 
 
+def test_static_file_route(client):
+    """Test static assets are served with caching headers."""
+    response = client.get("/app.js")
+    assert response.status_code == 200
+    assert "max-age=3600" in response.headers["Cache-Control"]
+    assert "ETag" in response.headers or "Last-Modified" in response.headers
+
+
+def test_static_file_not_modified(client):
+    """Test conditional static requests are answered from the manifest."""
+    etag = client.get("/app.js").headers["ETag"]
+
+    response = client.get("/app.js", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+@pytest.mark.parametrize(
+    "path", ["/../pyproject.toml", "/%2e%2e/pyproject.toml", "/missing.js"]
+)
+def test_static_file_outside_manifest(client, path):
+    """Test paths outside the static folder are never served."""
+    assert client.get(path).status_code == 404
+
+
+def test_static_file_uses_file_wrapper(flask_app):
+    """Test static files are handed to wsgi.file_wrapper with a Content-Length."""
+    import os
+
+    from werkzeug.test import EnvironBuilder
+
+    file_wrapper = MagicMock(return_value=[b""])
+    environ = EnvironBuilder(path="/app.js").get_environ()
+    environ["wsgi.file_wrapper"] = file_wrapper
+    headers = {}
+
+    def start_response(status, response_headers, exc_info=None):
+        headers.update(response_headers)
+
+    flask_app.wsgi_app(environ, start_response)
+
+    file_wrapper.assert_called_once()
+    size = os.path.getsize(os.path.join(flask_app.static_folder, "app.js"))
+    assert headers["Content-Length"] == str(size)
+
+
+def test_health(client_with_controller, mock_controller):
+    """Test GET /api/health responds without touching speakers."""
+    response = client_with_controller.get("/api/health")
+    assert response.status_code == 200
+    assert json.loads(response.data) == {"status": "ok"}
+    assert mock_controller.method_calls == []
+
+
+def test_api_import_does_not_load_soco():
+    """Test the API module can be imported without pulling in SoCo."""
+    code = "import sys, zoneos.api, zoneos.favorites; print('soco' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
 def test_list_speakers(client_with_controller, mock_controller):
     """Test GET /api/speakers endpoint."""
     response = client_with_controller.get("/api/speakers")
@@ -57,9 +125,6 @@ def test_list_speakers(client_with_controller, mock_controller):
 
 def test_list_speakers_no_controller(client):
     """Test GET /api/speakers with no controller initialized."""
-    import zoneos.api
-
-    zoneos.api.sonos_controller = None
     response = client.get("/api/speakers")
     assert response.status_code == 503
 
@@ -87,8 +152,7 @@ def test_play_favorite_success(client_with_controller, mock_controller):
 
     response = client_with_controller.post(
         "/api/play-favorite",
-        data=json.dumps({"speaker": "Living Room", "favorite": "Radio 1"}),
-        content_type="application/json",
+        json={"speaker": "Living Room", "favorite": "Radio 1"},
     )
 
     assert response.status_code == 200
@@ -101,10 +165,22 @@ def test_play_favorite_missing_fields(client_with_controller):
     """Test POST /api/play-favorite with missing fields."""
     response = client_with_controller.post(
         "/api/play-favorite",
-        data=json.dumps({"speaker": "Living Room"}),
-        content_type="application/json",
+        json={"speaker": "Living Room"},
     )
     assert response.status_code == 400
+    assert json.loads(response.data) == {
+        "error": "Missing 'speaker' or 'favorite' field"
+    }
+
+
+@pytest.mark.parametrize("body", ["not json", "[1, 2]", ""])
+def test_play_favorite_malformed_json(client_with_controller, mock_controller, body):
+    """Test POST /api/play-favorite with a body that is not a JSON object."""
+    response = client_with_controller.post(
+        "/api/play-favorite", data=body, content_type="application/json"
+    )
+    assert response.status_code == 400
+    mock_controller.play_favorite.assert_not_called()
 
 
 def test_play_favorite_failure(client_with_controller, mock_controller):
@@ -113,33 +189,32 @@ def test_play_favorite_failure(client_with_controller, mock_controller):
 
     response = client_with_controller.post(
         "/api/play-favorite",
-        data=json.dumps({"speaker": "Living Room", "favorite": "Unknown"}),
-        content_type="application/json",
+        json={"speaker": "Living Room", "favorite": "Unknown"},
     )
     assert response.status_code == 400
 
 
-def test_control_playback_success(client_with_controller, mock_controller):
+@pytest.mark.parametrize("action", ["play", "pause", "stop", "next", "previous"])
+def test_control_playback_success(client_with_controller, mock_controller, action):
     """Test POST /api/control endpoint."""
     mock_controller.control_playback.return_value = True
 
-    for action in ["play", "pause", "stop", "next", "previous"]:
-        response = client_with_controller.post(
-            "/api/control",
-            data=json.dumps({"speaker": "Living Room", "action": action}),
-            content_type="application/json",
-        )
-        assert response.status_code == 200
+    response = client_with_controller.post(
+        "/api/control",
+        json={"speaker": "Living Room", "action": action},
+    )
+    assert response.status_code == 200
+    mock_controller.control_playback.assert_called_once_with("Living Room", action)
 
 
 def test_control_playback_invalid_action(client_with_controller):
     """Test POST /api/control with invalid action."""
     response = client_with_controller.post(
         "/api/control",
-        data=json.dumps({"speaker": "Living Room", "action": "invalid"}),
-        content_type="application/json",
+        json={"speaker": "Living Room", "action": "invalid"},
     )
     assert response.status_code == 400
+    assert "Invalid action" in json.loads(response.data)["error"]
 
 
 def test_set_volume_success(client_with_controller, mock_controller):
@@ -148,8 +223,7 @@ def test_set_volume_success(client_with_controller, mock_controller):
 
     response = client_with_controller.post(
         "/api/volume",
-        data=json.dumps({"speaker": "Living Room", "volume": 75}),
-        content_type="application/json",
+        json={"speaker": "Living Room", "volume": 75},
     )
 
     assert response.status_code == 200
@@ -157,19 +231,12 @@ def test_set_volume_success(client_with_controller, mock_controller):
     mock_controller.set_volume.assert_called_once_with("Living Room", 75)
 
 
-def test_set_volume_invalid_range(client_with_controller):
+@pytest.mark.parametrize("volume", [150, -10])
+def test_set_volume_invalid_range(client_with_controller, volume):
     """Test POST /api/volume with invalid volume range."""
     response = client_with_controller.post(
         "/api/volume",
-        data=json.dumps({"speaker": "Living Room", "volume": 150}),
-        content_type="application/json",
-    )
-    assert response.status_code == 400
-
-    response = client_with_controller.post(
-        "/api/volume",
-        data=json.dumps({"speaker": "Living Room", "volume": -10}),
-        content_type="application/json",
+        json={"speaker": "Living Room", "volume": volume},
     )
     assert response.status_code == 400
 
@@ -178,8 +245,7 @@ def test_set_volume_non_integer(client_with_controller):
     """Test POST /api/volume with non-integer volume."""
     response = client_with_controller.post(
         "/api/volume",
-        data=json.dumps({"speaker": "Living Room", "volume": "fifty"}),
-        content_type="application/json",
+        json={"speaker": "Living Room", "volume": "fifty"},
     )
     assert response.status_code == 400
 
@@ -190,10 +256,7 @@ def test_play_uri_success(client_with_controller, mock_controller):
 
     response = client_with_controller.post(
         "/api/play-uri",
-        data=json.dumps(
-            {"speaker": "Living Room", "uri": "http://example.com/audio.mp3"}
-        ),
-        content_type="application/json",
+        json={"speaker": "Living Room", "uri": "http://example.com/audio.mp3"},
     )
 
     assert response.status_code == 200
@@ -212,6 +275,33 @@ def test_list_favorites(client_with_controller, mock_controller):
     assert len(data["favorites"]) == 2
 
 
+def test_list_favorites_compressed(client_with_controller, mock_controller):
+    """Test large JSON responses are compressed when the client accepts it."""
+    favorites = [{"title": f"Radio {i}", "uri": f"x-rincon:{i}"} for i in range(100)]
+    mock_controller.get_favorites_json.return_value = json.dumps(
+        {"favorites": favorites}
+    ).encode()
+
+    response = client_with_controller.get(
+        "/api/favorites", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+
+    response = client_with_controller.get("/api/speakers")
+    assert "Content-Encoding" not in response.headers
+
+
+def test_stream_favorites(client_with_controller, mock_controller):
+    """Test GET /api/favorites.ndjson streams one favorite per line."""
+    response = client_with_controller.get("/api/favorites.ndjson")
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+
+    lines = response.data.decode().splitlines()
+    assert [json.loads(line) for line in lines] == mock_controller.get_favorites()
+
+
 def test_refresh_favorites_success(client_with_controller, mock_controller):
     """Test POST /api/favorites/refresh endpoint."""
     mock_controller.refresh_favorites.return_value = True
@@ -229,8 +319,7 @@ def test_set_group_success(client_with_controller, mock_controller):
 
     response = client_with_controller.post(
         "/api/group",
-        data=json.dumps({"speakers": ["Living Room", "Bedroom"]}),
-        content_type="application/json",
+        json={"speakers": ["Living Room", "Bedroom"]},
     )
 
     assert response.status_code == 200
@@ -240,7 +329,7 @@ def test_set_group_success(client_with_controller, mock_controller):
 def test_set_group_empty_list(client_with_controller):
     """Test POST /api/group with empty speaker list."""
     response = client_with_controller.post(
-        "/api/group", data=json.dumps({"speakers": []}), content_type="application/json"
+        "/api/group", json={"speakers": []}
     )
     assert response.status_code == 400
 
@@ -251,20 +340,19 @@ def test_play_favorite_by_index_success(client_with_controller, mock_controller)
 
     response = client_with_controller.post(
         "/api/play-favorite-index",
-        data=json.dumps({"index": 0}),
-        content_type="application/json",
+        json={"index": 0},
     )
 
     assert response.status_code == 200
     mock_controller.play_favorite_by_index.assert_called_once_with(0)
 
 
-def test_play_favorite_by_index_invalid(client_with_controller):
+@pytest.mark.parametrize("index", [-1, "0", 1.5])
+def test_play_favorite_by_index_invalid(client_with_controller, index):
     """Test POST /api/play-favorite-index with invalid index."""
     response = client_with_controller.post(
         "/api/play-favorite-index",
-        data=json.dumps({"index": -1}),
-        content_type="application/json",
+        json={"index": index},
     )
     assert response.status_code == 400
 
@@ -277,6 +365,7 @@ def test_get_now_playing(client_with_controller, mock_controller):
     data = json.loads(response.data)
     assert data["title"] == "Test Song"
     assert data["artist"] == "Test Artist"
+    assert response.headers["Cache-Control"] == "max-age=1"
 
 
 def test_get_now_playing_no_data(client_with_controller, mock_controller):
@@ -319,3 +408,21 @@ def test_play_next_favorite_failure(client_with_controller, mock_controller):
 
     response = client_with_controller.get("/api/next")
     assert response.status_code == 400
+
+
+def test_json_responses_are_compact(client_with_controller):
+    """Test JSON responses are serialized compactly by the orjson provider."""
+    from zoneos.api import OrjsonProvider
+
+    assert isinstance(client_with_controller.application.json, OrjsonProvider)
+
+    response = client_with_controller.get("/api/speakers")
+    assert response.status_code == 200
+    assert response.data == b'{"speakers":["Living Room","Bedroom"]}\n'
+
+
+def test_json_responses_preserve_key_order(client_with_controller):
+    """Test JSON responses keep insertion order instead of sorting keys."""
+    response = client_with_controller.get("/api/now-playing")
+    assert response.status_code == 200
+    assert response.data.startswith(b'{"title":"Test Song","artist":')
@@ -1,10 +1,15 @@
 """Test basic Sonos controller functionality."""
 
+import json
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from zoneos.config import config
 from zoneos.controller import SonosController
+from zoneos.exceptions import NoSpeakersAvailableError
 
 
 @pytest.fixture
@@ -32,6 +37,109 @@ def test_discover_speakers(mock_soco_discover, mock_speaker):
     assert "Living Room" in controller.list_speakers()
 
 
+def test_discovery_does_not_block_startup(mock_soco_discover, mock_speaker):
+    """Test the controller is created before discovery finishes."""
+    release = threading.Event()
+
+    def slow_discover(**kwargs):
+        release.wait(timeout=5)
+        return [mock_speaker]
+
+    mock_soco_discover.side_effect = slow_discover
+
+    controller = SonosController()
+    assert not controller.speakers._discovered.is_set()
+
+    release.set()
+    assert controller.list_speakers() == ["Living Room"]
+
+
+def test_discovery_uses_configured_options(mock_soco_discover, mock_speaker):
+    """Test discovery passes the timeout and network scan settings to SoCo."""
+    mock_soco_discover.return_value = [mock_speaker]
+
+    controller = SonosController()
+    controller.list_speakers()
+
+    mock_soco_discover.assert_called_once_with(
+        timeout=config.discovery_timeout,
+        allow_network_scan=config.discovery_network_scan,
+    )
+
+
+def test_discovered_speakers_are_cached(
+    mock_soco_discover, mock_speaker, speaker_cache_path
+):
+    """Test discovery writes speaker names and addresses to the cache file."""
+    mock_speaker.ip_address = "192.168.1.10"
+    mock_soco_discover.return_value = [mock_speaker]
+
+    controller = SonosController()
+    controller.list_speakers()
+
+    data = json.loads(speaker_cache_path.read_text())
+    assert data["speakers"] == {"Living Room": "192.168.1.10"}
+
+
+def test_cached_speakers_available_before_discovery(
+    mock_soco_discover, speaker_cache_path
+):
+    """Test cached speakers are served while discovery is still running."""
+    speaker_cache_path.write_text(
+        json.dumps({"saved_at": time.time(), "speakers": {"Den": "192.168.1.20"}})
+    )
+    release = threading.Event()
+    mock_soco_discover.side_effect = lambda **kwargs: release.wait(timeout=5) and []
+
+    with patch("zoneos.speakers.soco.SoCo") as mock_soco:
+        controller = SonosController()
+        assert controller.list_speakers() == ["Den"]
+        mock_soco.assert_called_once_with("192.168.1.20")
+    release.set()
+
+
+def test_stale_speaker_cache_is_ignored(mock_soco_discover, speaker_cache_path):
+    """Test a speaker cache older than the TTL is not used."""
+    speaker_cache_path.write_text(
+        json.dumps({"saved_at": 0, "speakers": {"Den": "192.168.1.20"}})
+    )
+    mock_soco_discover.return_value = []
+
+    controller = SonosController()
+
+    assert controller.list_speakers() == []
+
+
+def test_get_speaker_ignores_case_and_whitespace(mock_soco_discover, mock_speaker):
+    """Test speaker lookup tolerates case and surrounding whitespace."""
+    mock_soco_discover.return_value = [mock_speaker]
+
+    controller = SonosController()
+
+    assert controller.get_speaker("living room") is mock_speaker
+    assert controller.get_speaker(" LIVING ROOM ") is mock_speaker
+    assert controller.get_speaker("Kitchen") is None
+
+
+def test_get_any_speaker(mock_soco_discover, mock_speakers):
+    """Test get_any_speaker returns the first discovered speaker."""
+    mock_soco_discover.return_value = mock_speakers
+
+    controller = SonosController()
+
+    assert controller.speakers.get_any_speaker() is mock_speakers[0]
+
+
+def test_get_any_speaker_none_available(mock_soco_discover):
+    """Test get_any_speaker raises when no speakers were discovered."""
+    mock_soco_discover.return_value = None
+
+    controller = SonosController()
+
+    with pytest.raises(NoSpeakersAvailableError):
+        controller.speakers.get_any_speaker()
+
+
 def test_no_speakers_found(mock_soco_discover):
     """Test when no speakers are found."""
     mock_soco_discover.return_value = None
@@ -1,125 +1,191 @@
 """Advanced tests for SonosController functionality."""
 
+import dataclasses
+import json
+import time
+from collections import namedtuple
+from unittest.mock import PropertyMock, call, patch
+
+import pytest
+import requests
 from soco.exceptions import SoCoException
 
+from zoneos.config import config
 from zoneos.controller import SonosController
 
+# Playback actions, each named after the SoCo method it calls
+PLAYBACK_ACTIONS = ("play", "pause", "stop", "next", "previous")
 
-def test_play_favorite_success(mock_soco_discover, mock_speaker, mock_favorite):
-    """Test playing a favorite successfully."""
-    mock_speaker.music_library.get_sonos_favorites.return_value = [mock_favorite]
+# Stand-in for a SoCo ZoneGroup, with just the attributes grouping reads
+Group = namedtuple("Group", "coordinator members")
+
+
+@pytest.mark.parametrize(
+    "found,error,expected",
+    [
+        pytest.param(True, None, True, id="success"),
+        pytest.param(False, None, False, id="not-found"),
+        pytest.param(False, SoCoException("Error"), False, id="exception"),
+    ],
+)
+def test_play_favorite(
+    mock_soco_discover, mock_speaker, mock_favorite, found, error, expected
+):
+    """Test playing a favorite by title, including missing and failing lookups."""
+    favorites = mock_speaker.music_library.get_sonos_favorites
+    favorites.return_value = [mock_favorite] if found else []
+    favorites.side_effect = error
     mock_soco_discover.return_value = [mock_speaker]
 
     controller = SonosController()
     result = controller.play_favorite("Living Room", "Test Favorite")
 
-    assert result is True
-    mock_speaker.play_uri.assert_called_once()
+    assert result is expected
+    assert mock_speaker.play_uri.called is expected
 
 
-def test_play_favorite_not_found(mock_soco_discover, mock_speaker):
-    """Test playing a favorite that doesn't exist."""
-    mock_speaker.music_library.get_sonos_favorites.return_value = []
-    mock_soco_discover.return_value = [mock_speaker]
+def test_initialization_is_lazy(mock_soco_discover, mock_speakers):
+    """Test favorites and group setup wait until first use, and run once."""
+    mock_soco_discover.return_value = mock_speakers
 
     controller = SonosController()
-    result = controller.play_favorite("Living Room", "Nonexistent")
+    assert controller.list_speakers() == ["Living Room", "Bedroom", "Kitchen"]
+    mock_speakers[0].music_library.get_sonos_favorites.assert_not_called()
+    mock_speakers[0].unjoin.assert_not_called()
 
-    assert result is False
+    controller.get_favorites()
+    controller.get_group_status()
+    mock_speakers[0].music_library.get_sonos_favorites.assert_called_once()
+    mock_speakers[0].unjoin.assert_called_once()
 
 
-def test_play_favorite_exception(mock_soco_discover, mock_speaker):
-    """Test playing favorite with SoCo exception."""
-    mock_speaker.music_library.get_sonos_favorites.side_effect = SoCoException("Error")
-    mock_soco_discover.return_value = [mock_speaker]
+def test_warm_up_initializes_in_background(mock_soco_discover, mock_speakers):
+    """Test warm-up loads favorites and the group without a request."""
+    mock_soco_discover.return_value = mock_speakers
+    warm_config = dataclasses.replace(config, warm_up_on_startup=True)
 
-    controller = SonosController()
-    result = controller.play_favorite("Living Room", "Test")
+    with patch("zoneos.controller.config", warm_config):
+        controller = SonosController()
+        deadline = time.monotonic() + 5
+        while not controller._initialized and time.monotonic() < deadline:
+            time.sleep(0.01)
 
-    assert result is False
+    assert controller._initialized
+    mock_speakers[0].music_library.get_sonos_favorites.assert_called_once()
+    assert controller.groups.get_coordinator() is mock_speakers[0]
 
 
-def test_control_playback_all_actions(mock_soco_discover, mock_speaker):
-    """Test all playback control actions."""
+def test_play_favorite_uses_cached_favorites(
+    mock_soco_discover, mock_speaker, mock_favorite
+):
+    """Test playing a favorite does not re-query the music library."""
+    mock_speaker.music_library.get_sonos_favorites.return_value = [mock_favorite]
     mock_soco_discover.return_value = [mock_speaker]
+
     controller = SonosController()
+    assert controller.play_favorite("Living Room", "Test Favorite") is True
+    assert controller.play_favorite("Living Room", "Test Favorite") is True
 
-    assert controller.control_playback("Living Room", "play") is True
-    mock_speaker.play.assert_called_once()
+    # Only the initial refresh should have hit the speaker
+    mock_speaker.music_library.get_sonos_favorites.assert_called_once()
 
-    assert controller.control_playback("Living Room", "pause") is True
-    mock_speaker.pause.assert_called_once()
 
-    assert controller.control_playback("Living Room", "stop") is True
-    mock_speaker.stop.assert_called_once()
+def test_play_favorite_uses_refresh_data(
+    mock_soco_discover, mock_speaker, mock_favorite
+):
+    """Test playing by title reads the URI and metadata captured at refresh."""
+    mock_speaker.music_library.get_sonos_favorites.return_value = [mock_favorite]
+    mock_soco_discover.return_value = [mock_speaker]
 
-    assert controller.control_playback("Living Room", "next") is True
-    mock_speaker.next.assert_called_once()
+    controller = SonosController()
+    controller.get_favorites()
+    mock_favorite.uri_reads = 0
 
-    assert controller.control_playback("Living Room", "previous") is True
-    mock_speaker.previous.assert_called_once()
+    assert controller.play_favorite("Living Room", "Test Favorite") is True
+    mock_speaker.play_uri.assert_called_once_with(
+        "x-rincon-cpcontainer:1004206c...", meta="<DIDL-Lite>...</DIDL-Lite>"
+    )
+    assert mock_favorite.uri_reads == 0
 
 
-def test_control_playback_invalid_action(mock_soco_discover, mock_speaker):
-    """Test control playback with invalid action."""
-    mock_soco_discover.return_value = [mock_speaker]
+def test_favorites_fail_over_to_responsive_speaker(
+    mock_soco_discover, mock_speakers, mock_favorite
+):
+    """Test favorites come from the next speaker when one fails, and stick to it."""
+    mock_speakers[0].music_library.get_sonos_favorites.side_effect = SoCoException(
+        "Timeout"
+    )
+    mock_speakers[1].music_library.get_sonos_favorites.return_value = [mock_favorite]
+    mock_soco_discover.return_value = mock_speakers
+
     controller = SonosController()
+    assert len(controller.get_favorites()) == 1
 
-    result = controller.control_playback("Living Room", "invalid_action")
-    assert result is False
+    assert controller.refresh_favorites() is True
+    mock_speakers[0].music_library.get_sonos_favorites.assert_called_once()
+    assert mock_speakers[1].music_library.get_sonos_favorites.call_count == 2
 
 
-def test_control_playback_exception(mock_soco_discover, mock_speaker):
-    """Test control playback with SoCo exception."""
-    mock_speaker.play.side_effect = SoCoException("Error")
+def test_stale_favorites_are_reloaded(mock_soco_discover, mock_speaker, mock_favorite):
+    """Test favorites are fetched again once they outlive the favorites TTL."""
+    mock_speaker.music_library.get_sonos_favorites.return_value = [mock_favorite]
     mock_soco_discover.return_value = [mock_speaker]
 
     controller = SonosController()
-    result = controller.control_playback("Living Room", "play")
+    controller.get_favorites()
+    controller.get_favorites()
+    mock_speaker.music_library.get_sonos_favorites.assert_called_once()
 
-    assert result is False
+    controller._favorites_loaded_at -= 3600
+    assert controller.get_favorites()[0]["title"] == "Test Favorite"
+    assert mock_speaker.music_library.get_sonos_favorites.call_count == 2
 
 
-def test_set_volume_boundary_values(mock_soco_discover, mock_speaker):
-    """Test setting volume with boundary values and rounding to modulo 5."""
-    mock_soco_discover.return_value = [mock_speaker]
-    controller = SonosController()
+@pytest.mark.parametrize("action", PLAYBACK_ACTIONS)
+def test_control_playback_all_actions(base_controller, base_speaker, action):
+    """Test all playback control actions."""
+    assert base_controller.control_playback("Living Room", action) is True
+    assert base_speaker.method_calls == [getattr(call, action)()]
 
-    # Test minimum
-    controller.set_volume("Living Room", 0)
-    assert mock_speaker.volume == 0
 
-    # Test maximum
-    controller.set_volume("Living Room", 100)
-    assert mock_speaker.volume == 100
+def test_control_playback_invalid_action(base_controller):
+    """Test control playback with invalid action."""
+    result = base_controller.control_playback("Living Room", "invalid_action")
+    assert result is False
 
-    # Test clamping above max (rounds to 150 -> 150, clamps to 100)
-    controller.set_volume("Living Room", 150)
-    assert mock_speaker.volume == 100
 
-    # Test clamping below min (rounds to -10 -> -10, clamps to 0)
-    controller.set_volume("Living Room", -10)
-    assert mock_speaker.volume == 0
+def test_control_playback_exception(base_controller, base_speaker):
+    """Test control playback with SoCo exception."""
+    base_speaker.play.side_effect = SoCoException("Error")
 
-    # Test rounding to nearest 5
-    controller.set_volume("Living Room", 23)  # Should round to 25
-    assert mock_speaker.volume == 25
+    result = base_controller.control_playback("Living Room", "play")
 
-    controller.set_volume("Living Room", 22)  # Should round to 20
-    assert mock_speaker.volume == 20
+    assert result is False
 
-    controller.set_volume("Living Room", 27)  # Should round to 25
-    assert mock_speaker.volume == 25
 
-    controller.set_volume("Living Room", 28)  # Should round to 30
-    assert mock_speaker.volume == 30
+@pytest.mark.parametrize(
+    "volume, expected",
+    [
+        (0, 0),  # minimum
+        (100, 100),  # maximum
+        (150, 100),  # clamped above max
+        (-10, 0),  # clamped below min
+        (23, 25),  # rounded to nearest 5
+        (22, 20),
+        (27, 25),
+        (28, 30),
+    ],
+)
+def test_set_volume_boundary_values(base_controller, base_speaker, volume, expected):
+    """Test setting volume with boundary values and rounding to modulo 5."""
+    base_controller.set_volume("Living Room", volume)
+    assert base_speaker.volume == expected
 
 
-def test_get_volume_exception(mock_soco_discover, mock_speaker):
+def test_get_volume_exception(mock_soco_discover, mock_speaker, monkeypatch):
     """Test getting volume with SoCo exception."""
-    type(mock_speaker).volume = property(
-        lambda self: (_ for _ in ()).throw(SoCoException("Error"))
-    )
+    volume = PropertyMock(side_effect=SoCoException("Error"))
+    monkeypatch.setattr(type(mock_speaker), "volume", volume, raising=False)
     mock_soco_discover.return_value = [mock_speaker]
 
     controller = SonosController()
@@ -128,46 +194,40 @@ def test_get_volume_exception(mock_soco_discover, mock_speaker):
     assert result is None
 
 
-def test_refresh_favorites_success(mock_soco_discover, mock_speaker, mock_favorite):
-    """Test refreshing favorites successfully."""
-    mock_speaker.music_library.get_sonos_favorites.return_value = [mock_favorite]
-    mock_speaker.music_library.get_favorite_radio_stations.return_value = []
-    mock_soco_discover.return_value = [mock_speaker]
+@pytest.mark.parametrize(
+    "discovered,error,expected",
+    [
+        pytest.param(True, None, True, id="success"),
+        pytest.param(False, None, False, id="no-speakers"),
+        pytest.param(True, SoCoException("Error"), False, id="exception"),
+    ],
+)
+def test_refresh_favorites(
+    mock_soco_discover, mock_speaker, mock_favorite, discovered, error, expected
+):
+    """Test refreshing favorites, including no speakers and failing lookups."""
+    favorites = mock_speaker.music_library.get_sonos_favorites
+    favorites.return_value = [mock_favorite]
+    favorites.side_effect = error
+    mock_soco_discover.return_value = [mock_speaker] if discovered else None
 
     controller = SonosController()
     result = controller.refresh_favorites()
 
-    assert result is True
+    assert result is expected
+    if not expected:
+        return
     favorites = controller.get_favorites()
     assert len(favorites) == 1
     assert favorites[0]["title"] == "Test Favorite"
 
+    favorites_json = json.loads(controller.get_favorites_json())
+    assert favorites_json == {"favorites": favorites}
 
-def test_refresh_favorites_no_speakers(mock_soco_discover):
-    """Test refreshing favorites with no speakers available."""
-    mock_soco_discover.return_value = None
-    controller = SonosController()
 
-    result = controller.refresh_favorites()
-    assert result is False
-
-
-def test_refresh_favorites_exception(mock_soco_discover, mock_speaker):
-    """Test refreshing favorites with SoCo exception."""
-    mock_speaker.music_library.get_sonos_favorites.side_effect = SoCoException("Error")
-    mock_soco_discover.return_value = [mock_speaker]
-
-    controller = SonosController()
-    result = controller.refresh_favorites()
-
-    assert result is False
-
-
-def test_group_operations(mock_soco_discover, mock_speakers):
+def test_group_operations(controller_with_speakers):
     """Test group creation and management."""
-    mock_soco_discover.return_value = mock_speakers
-
-    controller = SonosController()
+    controller = controller_with_speakers
 
     # Initial group should have all speakers
     coordinator = controller.get_group_coordinator()
@@ -204,19 +264,15 @@ def test_add_speaker_to_empty_group(mock_soco_discover, mock_speaker):
     assert controller.get_group_coordinator() is not None
 
 
-def test_remove_speaker_from_group(mock_soco_discover, mock_speakers):
+def test_remove_speaker_from_group(controller_with_speakers):
     """Test removing a speaker from group."""
-    mock_soco_discover.return_value = mock_speakers
-    controller = SonosController()
-
-    result = controller._remove_speaker_from_group("Kitchen")
+    result = controller_with_speakers._remove_speaker_from_group("Kitchen")
     assert result is True
 
 
-def test_remove_coordinator_from_group(mock_soco_discover, mock_speakers):
+def test_remove_coordinator_from_group(controller_with_speakers):
     """Test removing coordinator promotes new coordinator."""
-    mock_soco_discover.return_value = mock_speakers
-    controller = SonosController()
+    controller = controller_with_speakers
 
     coordinator_name = controller.get_group_coordinator().player_name
 
@@ -229,119 +285,210 @@ def test_remove_coordinator_from_group(mock_soco_discover, mock_speakers):
     assert new_coordinator.player_name != coordinator_name
 
 
-def test_remove_last_speaker(mock_soco_discover, mock_speaker):
+@pytest.mark.parametrize(
+    "error", [SoCoException("Error"), requests.ConnectionError("Unreachable")]
+)
+@pytest.mark.parametrize("operation", ["add", "remove"])
+def test_group_membership_failure_raises_group_error(mock_speakers, operation, error):
+    """Test a failing join or unjoin surfaces as a GroupOperationError."""
+    from zoneos.exceptions import GroupOperationError
+    from zoneos.groups import GroupManager
+
+    speakers = {s.player_name: s for s in mock_speakers}
+    groups = GroupManager()
+    groups._coordinator = mock_speakers[0]
+    groups._members = frozenset(("Living Room", "Bedroom"))
+    if operation == "add":
+        mock_speakers[2].join.side_effect = error
+        with pytest.raises(GroupOperationError):
+            groups._add_speaker(speakers, "Kitchen")
+    else:
+        mock_speakers[1].unjoin.side_effect = error
+        with pytest.raises(GroupOperationError):
+            groups._remove_speaker(speakers, "Bedroom")
+    assert groups.get_members() == {"Living Room", "Bedroom"}
+
+
+def test_remove_last_speaker(base_controller):
     """Test removing the last speaker from group."""
-    mock_soco_discover.return_value = [mock_speaker]
-    controller = SonosController()
+    result = base_controller._remove_speaker_from_group("Living Room")
+    assert result is True
+    assert base_controller.get_group_coordinator() is None
+
+
+def test_play_favorite_by_index_success(base_controller, base_speaker, mock_favorite):
+    """Test playing favorite by index (0-based)."""
+    base_speaker.music_library.get_sonos_favorites.return_value = [mock_favorite]
+    base_speaker.music_library.get_favorite_radio_stations.return_value = []
+
+    result = base_controller.play_favorite_by_index(0)
 
-    result = controller._remove_speaker_from_group("Living Room")
     assert result is True
-    assert controller.get_group_coordinator() is None
+    base_speaker.play_uri.assert_called()
 
 
-def test_play_favorite_by_index_success(
+def test_play_favorite_by_index_uses_refresh_data(
     mock_soco_discover, mock_speaker, mock_favorite
 ):
-    """Test playing favorite by index (0-based)."""
+    """Test playing by index uses the URI and metadata captured at refresh."""
     mock_speaker.music_library.get_sonos_favorites.return_value = [mock_favorite]
-    mock_speaker.music_library.get_favorite_radio_stations.return_value = []
     mock_soco_discover.return_value = [mock_speaker]
 
     controller = SonosController()
-    result = controller.play_favorite_by_index(0)
+    controller.get_favorites()
+    mock_favorite.uri_reads = 0
 
-    assert result is True
-    mock_speaker.play_uri.assert_called()
+    assert controller.play_favorite_by_index(0) is True
+    mock_speaker.play_uri.assert_called_once_with(
+        "x-rincon-cpcontainer:1004206c...", meta="<DIDL-Lite>...</DIDL-Lite>"
+    )
+    mock_speaker.music_library.get_sonos_favorites.assert_called_once()
+    assert mock_favorite.uri_reads == 0
 
 
-def test_play_favorite_by_index_invalid(mock_soco_discover, mock_speaker):
-    """Test playing favorite with invalid index."""
+def test_play_favorite_by_index_without_metadata(
+    mock_soco_discover, mock_speaker, make_favorite
+):
+    """Test a radio station without favorite metadata is kept and playable."""
+    station = make_favorite("Radio", "x-sonosapi-stream:s1234")
     mock_speaker.music_library.get_sonos_favorites.return_value = []
-    mock_speaker.music_library.get_favorite_radio_stations.return_value = []
+    mock_speaker.music_library.get_favorite_radio_stations.return_value = [station]
     mock_soco_discover.return_value = [mock_speaker]
 
     controller = SonosController()
 
+    assert controller.get_favorites() == [
+        {"title": "Radio", "uri": "x-sonosapi-stream:s1234"}
+    ]
+    assert controller.play_favorite_by_index(0) is True
+    mock_speaker.play_uri.assert_called_once_with("x-sonosapi-stream:s1234")
+
+
+def test_play_favorite_by_index_invalid(base_controller):
+    """Test playing favorite with invalid index."""
     # Test index out of bounds (no favorites available)
-    result = controller.play_favorite_by_index(0)
+    result = base_controller.play_favorite_by_index(0)
     assert result is False
 
     # Test negative index
-    result = controller.play_favorite_by_index(-1)
+    result = base_controller.play_favorite_by_index(-1)
     assert result is False
 
 
 def test_play_favorite_by_index_no_coordinator(
-    mock_soco_discover, mock_speaker, mock_favorite
+    base_controller, base_speaker, mock_favorite
 ):
     """Test playing favorite without coordinator auto-initializes group."""
-    mock_speaker.music_library.get_sonos_favorites.return_value = [mock_favorite]
-    mock_speaker.music_library.get_favorite_radio_stations.return_value = []
-    mock_soco_discover.return_value = [mock_speaker]
+    base_speaker.music_library.get_sonos_favorites.return_value = [mock_favorite]
+    base_speaker.music_library.get_favorite_radio_stations.return_value = []
+
+    # Verify group coordinator was initialized
+    assert base_controller.get_group_coordinator() is not None
+
+
+def test_play_favorite_by_index_retries_failed_group_init(
+    mock_soco_discover, mock_speakers, mock_favorite
+):
+    """Test a failed startup grouping is retried once when playing by index."""
+    mock_speakers[0].music_library.get_sonos_favorites.return_value = [mock_favorite]
+    mock_speakers[0].unjoin.side_effect = [SoCoException("Error"), None]
+    mock_soco_discover.return_value = mock_speakers
 
     controller = SonosController()
+    assert controller.get_group_coordinator() is None
 
-    # Verify group coordinator was initialized
-    assert controller.get_group_coordinator() is not None
+    assert controller.play_favorite_by_index(0) is True
+    assert controller.play_favorite_by_index(0) is True
+    assert mock_speakers[0].unjoin.call_count == 2
+    mock_speakers[1].join.assert_called_once_with(mock_speakers[0])
 
 
-def test_get_now_playing_success(mock_soco_discover, mock_speaker):
+def test_get_now_playing_success(base_controller, base_speaker):
     """Test getting now playing information."""
-    mock_speaker.get_current_track_info.return_value = {
+    base_speaker.get_current_track_info.return_value = {
         "title": "Test Song",
         "artist": "Test Artist",
         "album_art": "http://example.com/art.jpg",
         "uri": "x-rincon-cpcontainer:1",
     }
-    mock_soco_discover.return_value = [mock_speaker]
 
-    controller = SonosController()
-    info = controller.get_now_playing()
+    info = base_controller.get_now_playing()
 
     assert info is not None
     assert info["title"] == "Test Song"
     assert info["artist"] == "Test Artist"
 
 
-def test_get_now_playing_no_coordinator(mock_soco_discover, mock_speaker):
-    """Test getting now playing without coordinator."""
-    mock_soco_discover.return_value = [mock_speaker]
-    controller = SonosController()
+def test_get_now_playing_is_cached(base_controller, base_speaker):
+    """Test now playing is cached between polls and invalidated by playback."""
+    base_speaker.get_current_track_info.return_value = {"title": "Test Song"}
+
+    base_controller.get_now_playing()
+    base_controller.get_now_playing()
+    base_speaker.get_current_track_info.assert_called_once()
+
+    base_controller.control_playback("Living Room", "next")
+    base_controller.get_now_playing()
+    assert base_speaker.get_current_track_info.call_count == 2
 
-    # Clear the coordinator properly
-    controller.groups._coordinator = None
 
-    info = controller.get_now_playing()
+def test_get_now_playing_no_coordinator(base_controller):
+    """Test getting now playing without coordinator."""
+    # Run the lazy group setup, then clear the coordinator
+    base_controller.get_group_coordinator()
+    base_controller.groups._coordinator = None
+
+    info = base_controller.get_now_playing()
     assert info is None
 
 
-def test_get_now_playing_exception(mock_soco_discover, mock_speaker):
+def test_get_now_playing_exception(base_controller, base_speaker):
     """Test getting now playing with SoCo exception."""
-    mock_speaker.get_current_track_info.side_effect = SoCoException("Error")
-    mock_soco_discover.return_value = [mock_speaker]
+    base_speaker.get_current_track_info.side_effect = SoCoException("Error")
 
-    controller = SonosController()
-    info = controller.get_now_playing()
+    info = base_controller.get_now_playing()
 
     assert info is None
 
 
-def test_get_group_status(mock_soco_discover, mock_speakers):
+def test_get_group_status(controller_with_speakers):
     """Test getting group status."""
+    status = controller_with_speakers.get_group_status()
+
+    assert "members" in status
+    assert "volumes" in status
+    assert len(status["members"]) == 3
+
+
+def test_get_group_status_no_group(mock_soco_discover):
+    """Test group status when there is no group."""
+    mock_soco_discover.return_value = None
+
+    controller = SonosController()
+    status = controller.get_group_status()
+
+    assert status == {"members": [], "volumes": {}}
+
+
+def test_get_group_status_skips_failed_volumes(
+    mock_soco_discover, mock_speakers, monkeypatch
+):
+    """Test group status omits speakers whose volume query fails."""
+    mock_speakers[0].volume = 30
+    mock_speakers[1].volume = 40
+    volume = PropertyMock(side_effect=SoCoException("Error"))
+    monkeypatch.setattr(type(mock_speakers[2]), "volume", volume, raising=False)
     mock_soco_discover.return_value = mock_speakers
 
     controller = SonosController()
     status = controller.get_group_status()
 
-    assert "members" in status
-    assert "volumes" in status
     assert len(status["members"]) == 3
+    assert status["volumes"] == {"Living Room": 30, "Bedroom": 40}
 
 
 def test_initialize_preserves_playing_group(mock_soco_discover, mock_speakers):
     """Test that initialize preserves existing group when content is playing."""
-    from unittest.mock import MagicMock
-
     # Set up speakers with one playing
     mock_soco_discover.return_value = mock_speakers
     playing_speaker = mock_speakers[0]
@@ -352,10 +499,8 @@ def test_initialize_preserves_playing_group(mock_soco_discover, mock_speakers):
     }
 
     # Mock group structure
-    mock_group = MagicMock()
-    mock_group.coordinator = playing_speaker
-    mock_group.members = mock_speakers[:2]  # Only first 2 speakers in group
-    playing_speaker.group = mock_group
+    # Only first 2 speakers in group
+    playing_speaker.group = Group(playing_speaker, tuple(mock_speakers[:2]))
 
     controller = SonosController()
 
@@ -368,15 +513,171 @@ def test_initialize_preserves_playing_group(mock_soco_discover, mock_speakers):
     mock_speakers[1].unjoin.assert_not_called()
 
 
+@pytest.mark.parametrize(
+    "error", [SoCoException("Error"), requests.ConnectionError("Unreachable")]
+)
+def test_initialize_detects_playing_despite_failed_probe(
+    mock_soco_discover, mock_speakers, error
+):
+    """Test a failed transport probe on one speaker doesn't hide another playing."""
+    mock_speakers[0].get_current_transport_info.side_effect = error
+    playing_speaker = mock_speakers[2]
+    playing_speaker.get_current_transport_info.return_value = {
+        "current_transport_state": "PAUSED_PLAYBACK"
+    }
+    playing_speaker.group.coordinator = playing_speaker
+    playing_speaker.group.members = [playing_speaker]
+    mock_soco_discover.return_value = mock_speakers
+
+    controller = SonosController()
+
+    assert controller.get_group_coordinator() is playing_speaker
+    assert controller.groups.get_members() == {"Kitchen"}
+    for speaker in mock_speakers:
+        speaker.unjoin.assert_not_called()
+
+
+def test_get_members_returns_immutable_snapshot(controller_with_speakers):
+    """Test get_members hands out the same frozenset until membership changes."""
+    controller = controller_with_speakers
+    controller.get_group_status()
+
+    members = controller.groups.get_members()
+    assert isinstance(members, frozenset)
+    assert controller.groups.get_members() is members
+
+    controller._remove_speaker_from_group("Kitchen")
+    assert "Kitchen" in members
+    assert "Kitchen" not in controller.groups.get_members()
+
+
+def test_control_playback_routes_group_member_to_coordinator(
+    controller_with_speakers, mock_speakers
+):
+    """Test controlling a group member sends the action to the coordinator."""
+    controller = controller_with_speakers
+    coordinator = controller.get_group_coordinator()
+    mock_speakers[2].group.coordinator = coordinator
+
+    assert controller.control_playback("Kitchen", "pause") is True
+    coordinator.pause.assert_called_once()
+    mock_speakers[2].pause.assert_not_called()
+
+
+def test_control_playback_follows_live_group(controller_with_speakers, mock_speakers):
+    """Test a member regrouped from the Sonos app is controlled in its new group."""
+    controller = controller_with_speakers
+    coordinator = controller.get_group_coordinator()
+    # Kitchen has since left the group and coordinates itself
+    mock_speakers[2].group.coordinator = mock_speakers[2]
+
+    assert controller.control_playback("Kitchen", "pause") is True
+    mock_speakers[2].pause.assert_called_once()
+    coordinator.pause.assert_not_called()
+
+
+def test_group_operations_match_names_ignoring_case(
+    controller_with_speakers, mock_speakers
+):
+    """Test names differing in case route and regroup like the discovered ones."""
+    controller = controller_with_speakers
+    coordinator = controller.get_group_coordinator()
+    mock_speakers[2].group.coordinator = coordinator
+
+    assert controller.control_playback(" kitchen ", "pause") is True
+    coordinator.pause.assert_called_once()
+    mock_speakers[2].pause.assert_not_called()
+
+    assert controller.set_group(["living room", "BEDROOM"]) is True
+    assert controller.groups.get_members() == {"Living Room", "Bedroom"}
+
+
+def test_set_group_unchanged_is_noop(controller_with_speakers, mock_speakers):
+    """Test re-submitting the current group touches no speakers or caches."""
+    controller = controller_with_speakers
+    status = controller.get_group_status()
+    for speaker in mock_speakers:
+        speaker.reset_mock()
+
+    assert controller.set_group(["Kitchen", "Bedroom", "Living Room"]) is True
+    assert controller.get_group_status() is status
+    for speaker in mock_speakers:
+        speaker.join.assert_not_called()
+        speaker.unjoin.assert_not_called()
+
+
+def test_initialize_skips_speakers_already_grouped(mock_soco_discover, mock_speakers):
+    """Test initialize does not regroup speakers already under the coordinator."""
+    coordinator = mock_speakers[0]
+    coordinator.all_groups = {Group(coordinator, tuple(mock_speakers[:2]))}
+    mock_soco_discover.return_value = mock_speakers
+
+    controller = SonosController()
+
+    assert controller.get_group_coordinator() is coordinator
+    assert len(controller.groups.get_members()) == 3
+    coordinator.unjoin.assert_not_called()
+    mock_speakers[1].unjoin.assert_not_called()
+    mock_speakers[1].join.assert_not_called()
+    mock_speakers[2].unjoin.assert_called_once()
+    mock_speakers[2].join.assert_called_once_with(coordinator)
+
+
+@pytest.mark.parametrize(
+    "error", [SoCoException("Error"), requests.ConnectionError("Unreachable")]
+)
+def test_initialize_continues_when_one_join_fails(
+    mock_soco_discover, mock_speakers, error
+):
+    """Test a failing speaker is left out of the group without aborting it."""
+    mock_speakers[1].join.side_effect = error
+    mock_soco_discover.return_value = mock_speakers
+
+    controller = SonosController()
+
+    assert controller.get_group_coordinator() is mock_speakers[0]
+    assert controller.groups.get_members() == {"Living Room", "Kitchen"}
+    mock_speakers[2].join.assert_called_once_with(mock_speakers[0])
+
+
+def test_initialize_keeps_speaker_that_joins_after_failed_unjoin(
+    mock_soco_discover, mock_speakers
+):
+    """Test membership follows the join even when the unjoin before it failed."""
+    mock_speakers[1].unjoin.side_effect = SoCoException("Error")
+    mock_soco_discover.return_value = mock_speakers
+
+    controller = SonosController()
+
+    assert controller.get_group_coordinator() is mock_speakers[0]
+    mock_speakers[1].join.assert_called_once_with(mock_speakers[0])
+    assert controller.groups.get_members() == {"Living Room", "Bedroom", "Kitchen"}
+
+
+def test_group_manager_caches_player_names(mock_speakers):
+    """Test GroupManager resolves each speaker's name only once."""
+    from zoneos.groups import GroupManager
+
+    player_name = PropertyMock(return_value="Office")
+    speaker = mock_speakers[0]
+    type(speaker).player_name = player_name
+
+    groups = GroupManager()
+    assert groups._name(speaker) == "Office"
+    assert groups._name(speaker) == "Office"
+    player_name.assert_called_once()
+    # Keyed by the speaker itself, so an entry cannot outlive its speaker's id
+    assert groups._name_cache == {speaker: "Office"}
+
+
 def test_initialize_creates_group_when_not_playing(mock_soco_discover, mock_speakers):
     """Test that initialize creates new group when no content is playing."""
     mock_soco_discover.return_value = mock_speakers
 
     # Mock transport info to indicate stopped state
+    stopped = {"current_transport_state": "STOPPED"}
     for speaker in mock_speakers:
-        speaker.get_current_transport_info.return_value = {
-            "current_transport_state": "STOPPED"
-        }
+        speaker.get_current_transport_info.return_value = stopped
 
     controller = SonosController()
 
@@ -389,87 +690,45 @@ def test_initialize_creates_group_when_not_playing(mock_soco_discover, mock_spea
         speaker.unjoin.assert_called()
 
 
-def test_play_next_favorite_success(mock_soco_discover, mock_speaker):
+def test_play_next_favorite_success(base_controller, base_speaker, make_favorites):
     """Test playing next favorite advances through the list."""
-    from unittest.mock import MagicMock
-
-    # Create multiple favorites
-    fav1 = MagicMock()
-    fav1.title = "Favorite 1"
-    fav1.get_uri.return_value = "uri1"
-    fav1.resource_meta_data = "<DIDL-Lite>1</DIDL-Lite>"
-
-    fav2 = MagicMock()
-    fav2.title = "Favorite 2"
-    fav2.get_uri.return_value = "uri2"
-    fav2.resource_meta_data = "<DIDL-Lite>2</DIDL-Lite>"
-
-    fav3 = MagicMock()
-    fav3.title = "Favorite 3"
-    fav3.get_uri.return_value = "uri3"
-    fav3.resource_meta_data = "<DIDL-Lite>3</DIDL-Lite>"
-
-    mock_speaker.music_library.get_sonos_favorites.return_value = [fav1, fav2, fav3]
-    mock_speaker.music_library.get_favorite_radio_stations.return_value = []
-    mock_soco_discover.return_value = [mock_speaker]
-
-    controller = SonosController()
+    base_speaker.music_library.get_sonos_favorites.return_value = make_favorites(3)
+    base_speaker.music_library.get_favorite_radio_stations.return_value = []
 
     # First call: starts at index 0, calculates next as (0+1)%3=1, plays favorite at index 1, sets index to 1
-    result = controller.play_next_favorite()
+    result = base_controller.play_next_favorite()
     assert result is True
     assert (
-        controller.current_favorite_index == 1
+        base_controller.current_favorite_index == 1
     )  # Played favorite at index 1 (second favorite)
 
     # Second call: at index 1, calculates next as (1+1)%3=2, plays favorite at index 2, sets index to 2
-    result = controller.play_next_favorite()
+    result = base_controller.play_next_favorite()
     assert result is True
     assert (
-        controller.current_favorite_index == 2
+        base_controller.current_favorite_index == 2
     )  # Played favorite at index 2 (third favorite)
 
     # Third call: at index 2, calculates next as (2+1)%3=0, plays favorite at index 0, sets index to 0
-    result = controller.play_next_favorite()
+    result = base_controller.play_next_favorite()
     assert result is True
-    assert controller.current_favorite_index == 0  # Rolled over to first favorite
+    assert base_controller.current_favorite_index == 0  # Rolled over to first favorite
 
 
-def test_play_next_favorite_rollover(mock_soco_discover, mock_speaker):
+def test_play_next_favorite_rollover(base_controller, base_speaker, make_favorites):
     """Test that play_next_favorite rolls over to the beginning."""
-    from unittest.mock import MagicMock
-
-    fav1 = MagicMock()
-    fav1.title = "Favorite 1"
-    fav1.get_uri.return_value = "uri1"
-    fav1.resource_meta_data = "<DIDL-Lite>1</DIDL-Lite>"
-
-    fav2 = MagicMock()
-    fav2.title = "Favorite 2"
-    fav2.get_uri.return_value = "uri2"
-    fav2.resource_meta_data = "<DIDL-Lite>2</DIDL-Lite>"
-
-    mock_speaker.music_library.get_sonos_favorites.return_value = [fav1, fav2]
-    mock_speaker.music_library.get_favorite_radio_stations.return_value = []
-    mock_soco_discover.return_value = [mock_speaker]
-
-    controller = SonosController()
+    base_speaker.music_library.get_sonos_favorites.return_value = make_favorites(2)
+    base_speaker.music_library.get_favorite_radio_stations.return_value = []
 
     # Play through the list
-    controller.play_next_favorite()  # index 0 -> plays index 1, sets to 1
-    controller.play_next_favorite()  # index 1 -> plays index 0 (rollover), sets to 0
+    base_controller.play_next_favorite()  # index 0 -> plays index 1, sets to 1
+    base_controller.play_next_favorite()  # index 1 -> plays index 0 (rollover), sets to 0
 
     # Verify we rolled over to index 0
-    assert controller.current_favorite_index == 0
+    assert base_controller.current_favorite_index == 0
 
 
-def test_play_next_favorite_no_favorites(mock_soco_discover, mock_speaker):
+def test_play_next_favorite_no_favorites(base_controller):
     """Test play_next_favorite when no favorites available."""
-    mock_speaker.music_library.get_sonos_favorites.return_value = []
-    mock_speaker.music_library.get_favorite_radio_stations.return_value = []
-    mock_soco_discover.return_value = [mock_speaker]
-
-    controller = SonosController()
-
-    result = controller.play_next_favorite()
+    result = base_controller.play_next_favorite()
     assert result is False